@@ -1,6 +1,7 @@
 from pythereum.rpc import (
     EthRPC,
     NonceManager,
+    RequestBatch,
 )
 
 from pythereum.common import (
@@ -46,6 +47,7 @@ from pythereum.exceptions import (
     PythereumSubscriptionException,
     PythereumBuilderException,
     PythereumManagerException,
+    PythereumPoolException,
     PythereumGenericException,
 )
 
@@ -55,6 +57,7 @@ from pythereum.l2_rpc import OptimismRPC
 
 from pythereum.utils import (
     to_checksum_address,
+    to_checksum_addresses,
     recover_raw_transaction,
     convert_eth,
     calculate_contract_address,
@@ -5,8 +5,8 @@ from abc import ABC
 from typing import Any
 
 import asyncio
-import json
 import aiohttp
+import orjson
 
 from eth_account import Account, messages
 from eth_utils import keccak
@@ -273,6 +273,7 @@ class BuilderRPC:
         | list[str]
         | list[bytes]
         | list[HexStr] = None,
+        connector: "aiohttp.BaseConnector | None" = None,
     ):
         if isinstance(builders, Builder):
             builders = [builders]
@@ -286,6 +287,10 @@ class BuilderRPC:
 
         self.private_key: bytes = private_key
         self.session = None
+        # An externally supplied connector is shared, not owned: closing the
+        # session leaves it open so keep-alive connections and cached DNS
+        # answers survive across BuilderRPC contexts on the same event loop
+        self._connector = connector
         self._id = 0
 
     async def __aenter__(self):
@@ -298,8 +303,8 @@ class BuilderRPC:
     def _next_id(self) -> None:
         self._id += 1
 
-    def _get_flashbots_header(self, payload: str = "") -> dict:
-        payload = messages.encode_defunct(keccak(text=payload))
+    def _get_flashbots_header(self, payload: bytes = b"") -> dict:
+        payload = messages.encode_defunct(keccak(payload))
         return {
             "X-Flashbots-Signature": f"{Account.from_key(self.private_key).address}:"
             f"{Account.sign_message(payload, self.private_key).signature.hex()}"
@@ -328,14 +333,15 @@ class BuilderRPC:
         use_flashbots_signature: bool = False,
     ):
         if self.session is not None:
-            constructed_json = self._build_json(method, params)
-            header_data = (
-                self._get_flashbots_header(json.dumps(constructed_json))
-                if use_flashbots_signature and self.private_key is not None
-                else None
-            )
+            # The body is serialized once with orjson and those exact bytes are
+            # both signed for the flashbots header and posted, so the signature
+            # always matches what the relay receives
+            payload = orjson.dumps(self._build_json(method, params))
+            header_data = {"Content-Type": "application/json"}
+            if use_flashbots_signature and self.private_key is not None:
+                header_data |= self._get_flashbots_header(payload)
             async with self.session.post(
-                builder.url, json=constructed_json, headers=header_data
+                builder.url, data=payload, headers=header_data
             ) as resp:
                 if resp.status != 200:
                     raise PythereumRequestException(
@@ -344,7 +350,7 @@ class BuilderRPC:
                         f"(method={method}, params={params})",
                     )
 
-                msg = await resp.json()
+                msg = orjson.loads(await resp.read())
         else:
             raise PythereumBuilderException(
                 "BuilderRPC session not started. Either context manage this class or call BuilderRPC.start_session()"
@@ -353,7 +359,12 @@ class BuilderRPC:
         return parse_results(msg, builder=builder.url)
 
     async def start_session(self):
-        self.session = aiohttp.ClientSession()
+        if self._connector is not None:
+            self.session = aiohttp.ClientSession(
+                connector=self._connector, connector_owner=False
+            )
+        else:
+            self.session = aiohttp.ClientSession()
 
     async def close_session(self):
         await self.session.close()
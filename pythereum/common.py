@@ -83,6 +83,8 @@ class HexStr(str):
 
     HEX_PATTERN = re.compile(r"^0x[0-9a-fA-F]+$")
 
+    __slots__ = ()
+
     def __new__(cls, value: str | int | bytes):
         if isinstance(value, str):
             formatted_value = cls._format_string_value(value)
@@ -97,6 +99,22 @@ class HexStr(str):
 
         return super().__new__(cls, formatted_value)
 
+    @classmethod
+    def _from_checked(cls, value: str) -> "HexStr":
+        """
+        Constructs a HexStr from an already "0x"-prefixed hex string, skipping validation.
+        Only for values produced by a trusted source such as an RPC result.
+        """
+        return str.__new__(cls, value)
+
+    @classmethod
+    def _from_int(cls, value: int) -> "HexStr":
+        """
+        Constructs a HexStr from a non-negative integer, skipping the
+        validation pass since hex() output is canonical by construction.
+        """
+        return str.__new__(cls, hex(value))
+
     @staticmethod
     def _format_string_value(value: str) -> str:
         """
@@ -5,16 +5,21 @@
 # Yes all these decoders are stupid, they will need refactoring soon.
 
 import re
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field
+from functools import lru_cache
 from dataclasses_json import dataclass_json, LetterCase, config
 from pythereum.common import HexStr
 from pythereum.exceptions import PythereumDecoderException, PythereumEncoderException
 
+# Compiled once so the decoders skip the regex-cache lookup re.match pays on
+# every call, these run for every hex field of every decoded response
+_HEX_PATTERN = re.compile(r"^(0[xX])?[A-Fa-f0-9]+$")
+
 
 def hex_int_decoder(hex_string: str | None) -> int | None:
     if hex_string is None:
         return None
-    elif re.match(r"^(0[xX])?[A-Fa-f0-9]+$", hex_string):
+    elif _HEX_PATTERN.match(hex_string):
         return int(hex_string, 16)
     else:
         raise PythereumDecoderException(
@@ -32,17 +37,29 @@ def hex_int_encoder(int_val: int | None) -> str | None:
     return hex(int_val)
 
 
-def hex_decoder(hex_string: str | None) -> HexStr | None:
-    if hex_string is None:
-        return None
-    elif re.match(r"^(0[xX])?[A-Fa-f0-9]+$", hex_string):
+# Memoized since a handful of values recur constantly across responses -
+# zero hashes, empty data fields, popular contract addresses and event
+# topics - and a repeat then costs a dict hit instead of validation
+@lru_cache(maxsize=4096)
+def _hex_decode(hex_string: str) -> HexStr | None:
+    if _HEX_PATTERN.match(hex_string):
+        # The pattern above already validated the value, so a "0x"-prefixed
+        # string can skip the second validation pass HexStr would run;
+        # this is the per-element cost of every list decode
+        if hex_string.startswith("0x"):
+            return HexStr._from_checked(hex_string)
         return HexStr(hex_string)
     elif hex_string == "0x":
         return None
-    else:
-        raise PythereumDecoderException(
-            f'{type(hex_string)} "{hex_string}" is an invalid input to decoder "hex_decoder"'
-        )
+    raise PythereumDecoderException(
+        f'{type(hex_string)} "{hex_string}" is an invalid input to decoder "hex_decoder"'
+    )
+
+
+def hex_decoder(hex_string: str | None) -> HexStr | None:
+    if hex_string is None:
+        return None
+    return _hex_decode(hex_string)
 
 
 def hex_encoder(hex_obj: HexStr | None) -> str | None:
@@ -90,7 +107,7 @@ def transaction_decoder(
     transaction_hex: dict | str | None,
 ) -> "TransactionFull | HexStr | None":
     if isinstance(transaction_hex, dict):
-        return TransactionFull.from_dict(transaction_hex, infer_missing=True)
+        return _transaction_from_dict(transaction_hex)
     elif transaction_hex is not None:
         return hex_decoder(transaction_hex)
     return None
@@ -100,7 +117,7 @@ def transaction_encoder(
     transaction_obj: "HexStr | TransactionFull | None",
 ) -> str | dict | None:
     if isinstance(transaction_obj, TransactionFull):
-        return transaction_obj.to_dict()
+        return _transaction_to_dict(transaction_obj)
     elif transaction_obj is not None:
         return hex_encoder(transaction_obj)
     return None
@@ -124,7 +141,7 @@ def transaction_list_encoder(
 
 def access_decoder(access_dict: dict | None) -> "Access | None":
     if access_dict is not None:
-        return Access.from_dict(access_dict, infer_missing=True)
+        return _access_from_dict(access_dict)
     return None
 
 
@@ -180,7 +197,7 @@ def storage_proof_list_encoder(
 
 def log_decoder(log_dict: dict | None) -> "Log | None":
     if log_dict is not None:
-        return Log.from_dict(log_dict)
+        return _log_from_dict(log_dict)
     return None
 
 
@@ -202,8 +219,68 @@ def log_list_encoder(log_obj_list: list["Log"] | None) -> list[dict] | None:
     return None
 
 
+def _camel(name: str) -> str:
+    head, *rest = name.split("_")
+    return head + "".join(part.title() for part in rest)
+
+
+def _compile_to_dict(cls):
+    """
+    Generates a to_dict function specialized to one dataclass at import time.
+    The generic dataclasses_json to_dict walks field metadata on every call;
+    emitting the exact dict literal once reduces each call to attribute loads
+    plus the already-bound field encoders.
+    """
+    namespace = {}
+    entries = []
+    for fld in cls.__dataclass_fields__.values():
+        meta = fld.metadata.get("dataclasses_json", {})
+        letter_case = meta.get("letter_case")
+        key = letter_case(fld.name) if letter_case is not None else _camel(fld.name)
+        encoder = meta.get("encoder")
+        if encoder is not None:
+            namespace[f"_encode_{fld.name}"] = encoder
+            entries.append(f'        "{key}": _encode_{fld.name}(obj.{fld.name}),')
+        else:
+            entries.append(f'        "{key}": obj.{fld.name},')
+    source = "def _to_dict(obj):\n    return {\n" + "\n".join(entries) + "\n    }\n"
+    exec(source, namespace)
+    return namespace["_to_dict"]
+
+
+def _compile_from_dict(cls):
+    """
+    Generates the from_dict counterpart to _compile_to_dict. Present keys run
+    the bound field decoder, missing keys fall back to the field default the
+    same way dataclasses_json resolves them; every decoder in this module
+    already passes None through, so absent optional fields stay None.
+    """
+    namespace = {"_cls": cls}
+    entries = []
+    for fld in cls.__dataclass_fields__.values():
+        meta = fld.metadata.get("dataclasses_json", {})
+        letter_case = meta.get("letter_case")
+        key = letter_case(fld.name) if letter_case is not None else _camel(fld.name)
+        if meta.get("decoder") is not None:
+            namespace[f"_decode_{fld.name}"] = meta["decoder"]
+            value = f'_decode_{fld.name}(data["{key}"])'
+        else:
+            value = f'data["{key}"]'
+        if fld.default_factory is not MISSING:
+            namespace[f"_default_{fld.name}"] = fld.default_factory
+            fallback = f"_default_{fld.name}()"
+        else:
+            fallback = repr(fld.default)
+        entries.append(
+            f'        {fld.name}={value} if "{key}" in data else {fallback},'
+        )
+    source = "def _from_dict(data):\n    return _cls(\n" + "\n".join(entries) + "\n    )\n"
+    exec(source, namespace)
+    return namespace["_from_dict"]
+
+
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True)
 class Block:
     """
     Full information about a block, either including full transactions or transaction hashes
@@ -211,132 +288,134 @@ class Block:
 
     # Integer of the difficulty for the block
     difficulty: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
 
     # The extra data field of the block
     extra_data: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
 
     # The maximum gas allowed on this block
     gas_limit: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
 
     # The total gas used by all transactions in this block
     gas_used: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
 
     # 32 Byte hash of a block, null if block is pending
     hash: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
 
     # 256 Bytes bloom filter for the logs of the block. Null if the block is pending
     logs_bloom: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
 
     # 20 Byte address of the beneficiary of mining rewards
     miner: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
 
     #
     mix_hash: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
 
     # 8 Byte hash of the generated proof of work. Null when the block is pending
     nonce: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
 
     # The block number. Null when the block is pending
     number: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
 
     # 32 Byte hash of the parent of the block
     parent_hash: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
 
     # 32 Byte root of the receipts trie of the block
     receipts_root: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
 
     # 32 Byte SHA3 of the uncles of the data in the block
     sha3_uncles: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
 
     # Integer size of the block in bytes
     size: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
 
     # 32 Byte root of the final state trie of the block
     state_root: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
 
     # The unix timestamp for when the block was collated
     timestamp: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
 
     # Integer of the total difficulty of the chain until this block
     total_difficulty: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
 
     # List of all transaction objects or 32 Byte transaction hashes for the block
     transactions: list["TransactionFull | HexStr"] | None = field(
+        default=None,
         metadata=config(
             decoder=transaction_list_decoder, encoder=transaction_list_encoder
-        )
+        ),
     )
 
     # 32 Byte root of the transaction trie of the block
     transactions_root: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
 
     # List of uncle hashes
     uncles: list[HexStr] | None = field(
-        metadata=config(decoder=hex_list_decoder, encoder=hex_list_encoder)
+        default=None,
+        metadata=config(decoder=hex_list_decoder, encoder=hex_list_encoder),
     )
 
     # The base fee per gas, only added after EIP-1559
     base_fee_per_gas: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True)
 class Sync:
     """
     Class representing ethereum sync status
     """
 
     starting_block: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
     current_block: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
     highest_block: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True)
 class Receipt:
     """
     A receipt generated by a transaction's execution
@@ -344,116 +423,123 @@ class Receipt:
 
     # 32 Byte hash of transaction
     transaction_hash: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
 
     # Integer of the transactions index position in the block
     transaction_index: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
 
     # 32 Byte hash of the block in which the transaction was contained
     block_hash: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
 
     # Block number of transaction
     block_number: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
 
     # 20 Byte sender address
     from_address: HexStr | None = field(
-        metadata=config(field_name="from", decoder=hex_decoder, encoder=hex_encoder)
+        default=None,
+        metadata=config(field_name="from", decoder=hex_decoder, encoder=hex_encoder),
     )
 
     # 20 Byte receiver address, can be null
     to_address: HexStr | None = field(
-        metadata=config(field_name="to", decoder=hex_decoder, encoder=hex_encoder)
+        default=None,
+        metadata=config(field_name="to", decoder=hex_decoder, encoder=hex_encoder),
     )
 
     # Total amount of gas used when this transaction was executed on the block
     cumulative_gas_used: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
 
     # The sum of the base fee and tip paid per unit gas
     effective_gas_price: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
 
     # The amount of gas used by this specific transaction alone
     gas_used: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
 
     # The 20 Byte contract address created
     contract_address: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
 
     # List of log objects, which this transaction generated
     logs: list["Log"] | None = field(
-        metadata=config(decoder=log_list_decoder, encoder=log_list_encoder)
+        default=None,
+        metadata=config(decoder=log_list_decoder, encoder=log_list_encoder),
     )
 
     # 256 Byte bloom for light clients to quickly retrieve related logs
     logs_bloom: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
 
     # Integer representation of transaction type, 0x0 for legacy, 0x1 for list, 0x2 for dynamic fees
     type: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
 
     # Optional: 1 (success) or 0 (failure)
     status: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
 
     # Optional: 32 Bytes of post-transaction stateroot
     root: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Log:
     """
     A log generated by smart contract event triggers
     """
 
     address: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
     block_hash: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
     block_number: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
     data: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
     log_index: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
     topics: list[HexStr] | None = field(
-        metadata=config(decoder=hex_list_decoder, encoder=hex_list_encoder)
+        default=None,
+        metadata=config(decoder=hex_list_decoder, encoder=hex_list_encoder),
     )
     transaction_hash: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
     transaction_index: int | None = field(
-        metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
+        default=None, metadata=config(decoder=hex_int_decoder, encoder=hex_int_encoder)
     )
-    removed: bool | None
+    removed: bool | None = None
+
+
+_log_from_dict = _compile_from_dict(Log)
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TransactionFull:
     """
     The full information on a transaction to be executed, including metadata with reference to its inclusion on chain
@@ -521,73 +607,85 @@ class TransactionFull:
     )
 
 
+_transaction_to_dict = _compile_to_dict(TransactionFull)
+_transaction_from_dict = _compile_from_dict(TransactionFull)
+
+
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Access:
     """
     Information on access lists available at https://eips.ethereum.org/EIPS/eip-2930
     """
 
     address: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
     storage_keys: list[HexStr] | None = field(
-        metadata=config(decoder=hex_list_decoder, encoder=hex_list_encoder)
+        default=None,
+        metadata=config(decoder=hex_list_decoder, encoder=hex_list_encoder),
     )
 
 
+_access_from_dict = _compile_from_dict(Access)
+
+
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True)
 class FeeHistory:
     oldest_block: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
     base_fee_per_gas: list[HexStr] | None = field(
-        metadata=config(decoder=hex_list_decoder, encoder=hex_list_encoder)
+        default=None,
+        metadata=config(decoder=hex_list_decoder, encoder=hex_list_encoder),
     )
-    gas_used_ratio: list[float] | None
+    gas_used_ratio: list[float] | None = None
     reward: list[list[HexStr]] | None = field(
-        metadata=config(decoder=hex_list_list_decoder, encoder=hex_list_list_encoder)
+        default=None,
+        metadata=config(decoder=hex_list_list_decoder, encoder=hex_list_list_encoder),
     )
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True)
 class StorageProof:
     key: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
     value: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
     proof: list[HexStr] | None = field(
-        metadata=config(decoder=hex_list_decoder, encoder=hex_list_encoder)
+        default=None,
+        metadata=config(decoder=hex_list_decoder, encoder=hex_list_encoder),
     )
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True)
 class Proof:
     balance: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
     code_hash: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
     nonce: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
     storage_hash: HexStr | None = field(
-        metadata=config(decoder=hex_decoder, encoder=hex_encoder)
+        default=None, metadata=config(decoder=hex_decoder, encoder=hex_encoder)
     )
     storage_proof: list[StorageProof] | None = field(
+        default=None,
         metadata=config(
             decoder=storage_proof_list_decoder, encoder=storage_proof_list_encoder
-        )
+        ),
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class MempoolInfo:
     pending: list[TransactionFull]
     queued: list[TransactionFull]
@@ -773,16 +871,17 @@ class MEVBundle(dict):
         if refund_percentages is None:
             refund_percentages = [100]
 
-        if isinstance(transactions_can_revert, bool):
-            transactions_can_revert = [
-                transactions_can_revert for _ in range(len(transactions))
-            ]
-
         res = {"version": version, "inclusion": {"block": block}, "body": []}
         if flashbots_hashes is not None:
             res["body"].extend([{"hash": f_hash} for f_hash in flashbots_hashes])
 
         if transactions is not None:
+            # The revert flag list is only materialised when there are
+            # transactions to pair it with, a bare bool is broadcast directly
+            if isinstance(transactions_can_revert, bool):
+                transactions_can_revert = [transactions_can_revert] * len(
+                    transactions
+                )
             res["body"].extend(
                 [
                     {"tx": tx, "canRevert": rvt}
@@ -60,6 +60,12 @@ class PythereumManagerException(PythereumBaseException):
     """
 
 
+class PythereumPoolException(PythereumBaseException):
+    """
+    Raised when the websocket pool cannot satisfy a socket checkout, e.g. a timeout while every socket is in flight
+    """
+
+
 class PythereumGenericException(PythereumBaseException):
     """
     Raised for exceptions which do not fall into any of the above categories, things like utility functions will use it
@@ -3,7 +3,9 @@
 # Further copyright info available at the end of the file
 
 import statistics
+from asyncio import gather
 from contextlib import asynccontextmanager
+from operator import attrgetter
 
 from pythereum.exceptions import (
     PythereumManagerException,
@@ -13,6 +15,13 @@ from pythereum.common import EthDenomination, GasStrategy, BlockTag
 from pythereum.rpc import EthRPC
 from pythereum.dclasses import TransactionFull, Transaction
 
+# Shared attrgetter instances for the price attributes, built once per name
+_ATTR_GETTERS: dict[str, callable] = {}
+
+
+def _price_getter(attribute: str):
+    return _ATTR_GETTERS.setdefault(attribute, attrgetter(attribute))
+
 
 class NaiveGasManager:
     """
@@ -34,6 +43,8 @@ class NaiveGasManager:
     ):
         self.rpc = rpc
         self.latest_transactions = None
+        # Memoized suggestion results for the currently stored receipts
+        self._suggest_cache = {}
         self.max_gas_price = int(
             max_gas_price if max_gas_price is not None else EthDenomination.milli
         )
@@ -54,12 +65,15 @@ class NaiveGasManager:
         These are gotten by getting the latest block info and requesting transaction receipts for each transaction.
         To avoid doing this for every call, there is the option to use stored results from the most recent request.
         """
-        if use_stored_results:
+        if use_stored_results and self.latest_transactions is not None:
             transactions = self.latest_transactions
         else:
+            # Falls through to a fresh fetch when no stored results exist yet
             latest_block = await self.rpc.get_block_by_number(BlockTag.latest, True)
             transactions = latest_block.transactions
             self.latest_transactions = transactions
+            # Fresh receipts invalidate previously memoized suggestions
+            self._suggest_cache.clear()
         if len(transactions) == 0:
             raise PythereumInvalidReturnException(
                 f"Invalid vlue: {transactions} returned from _get_latest_receipts"
@@ -70,41 +84,71 @@ class NaiveGasManager:
         self, strategy: GasStrategy, attribute: str, use_stored_results: bool = False
     ) -> float:
         transactions = await self._get_latest_receipts(use_stored_results)
-        prices = [
-            getattr(x, attribute)
-            for x in transactions
-            if getattr(x, attribute) is not None
-        ]
-        match strategy:
-            case GasStrategy.min_price:
-                res = min(prices)
-            case GasStrategy.max_price:
-                res = max(prices)
-            case GasStrategy.median_price:
-                res = statistics.median(prices)
-            case GasStrategy.mean_price:
-                res = statistics.mean(prices)
-            case GasStrategy.mode_price:
-                res = statistics.mode(prices)
-            case GasStrategy.upper_quartile_price:
-                # Quantiles require enough data points or they will crash
-                try:
-                    res = statistics.quantiles(prices, n=4)[2]
-                except statistics.StatisticsError:
-                    res = statistics.mean(prices)
-            case GasStrategy.lower_quartile_price:
-                # Quantiles require enough data points or they will crash
-                try:
-                    res = statistics.quantiles(prices, n=4)[0]
-                except statistics.StatisticsError:
-                    res = statistics.mean(prices)
-            case GasStrategy.custom:
+        cache_key = (attribute, strategy)
+        cached = self._suggest_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # The cached attrgetter runs extraction through C-level map with a
+        # single attribute lookup per transaction
+        getter = _price_getter(attribute)
+        if strategy is GasStrategy.min_price:
+            # Fused single pass, no intermediate list or sort needed
+            res = min(v for v in map(getter, transactions) if v is not None)
+        elif strategy is GasStrategy.max_price:
+            res = max(v for v in map(getter, transactions) if v is not None)
+        else:
+            prices = [v for v in map(getter, transactions) if v is not None]
+            # Sorting once keeps the median / quantile computations linear
+            # over the pre-ordered data
+            prices.sort()
+            if strategy is GasStrategy.custom:
                 res = self.custom_pricing(prices)
-            case _:
-                raise PythereumManagerException(
-                    f"Invalid strategy of type {strategy} used"
-                )
-        return round(res)
+            else:
+                try:
+                    res = self._STRATEGY_FN[strategy](prices)
+                except KeyError:
+                    raise PythereumManagerException(
+                        f"Invalid strategy of type {strategy} used"
+                    ) from None
+        res = round(res)
+        self._suggest_cache[cache_key] = res
+        return res
+
+    @staticmethod
+    def _quartile(prices: list[float], cut: int) -> float:
+        """
+        Interpolates a single quartile cut point directly into the
+        pre-sorted price list, equivalent to statistics.quantiles(n=4)[cut - 1]
+        without re-sorting the data or building the other cut points
+        """
+        count = len(prices)
+        if count < 2:
+            # Quantiles require enough data points or they will crash
+            return statistics.fmean(prices)
+        m = cut * (count + 1)
+        j = m // 4
+        j = 1 if j < 1 else count - 1 if j > count - 1 else j
+        delta = m - j * 4
+        return (prices[j - 1] * (4 - delta) + prices[j] * delta) / 4
+
+    @staticmethod
+    def _upper_quartile(prices: list[float]) -> float:
+        return NaiveGasManager._quartile(prices, 3)
+
+    @staticmethod
+    def _lower_quartile(prices: list[float]) -> float:
+        return NaiveGasManager._quartile(prices, 1)
+
+    # Strategy dispatch over pre-sorted prices, one dict lookup instead of a
+    # match ladder evaluated on every suggestion. min / max are handled
+    # before list construction in suggest and do not appear here
+    _STRATEGY_FN = {
+        GasStrategy.median_price: statistics.median,
+        GasStrategy.mean_price: statistics.fmean,
+        GasStrategy.mode_price: statistics.mode,
+        GasStrategy.upper_quartile_price: _upper_quartile.__func__,
+        GasStrategy.lower_quartile_price: _lower_quartile.__func__,
+    }
 
     async def fill_transaction(
         self,
@@ -122,27 +166,24 @@ class NaiveGasManager:
             }
 
         if isinstance(tx, list):
+            # The suggestions are identical for every transaction in the list,
+            # so they are computed once up front rather than per transaction.
+            # The gas suggestion runs first so the later two can reuse its
+            # stored receipts
+            gas = await self.suggest(strategy["gas"], "gas", use_stored)
+            fee, priority = await gather(
+                self.suggest(strategy["maxFeePerGas"], "max_fee_per_gas", True),
+                self.suggest(
+                    strategy["maxPriorityFeePerGas"], "max_priority_fee_per_gas", True
+                ),
+            )
+            gas = min(gas, self.max_gas_price)
+            fee = min(fee, self.max_fee_price)
+            priority = min(priority, self.max_priority_price)
             for sub_tx in tx:
-                sub_tx["gas"] = min(
-                    await self.suggest(strategy["gas"], "gas", use_stored),
-                    self.max_gas_price,
-                )
-
-                sub_tx["maxFeePerGas"] = min(
-                    await self.suggest(
-                        strategy["maxFeePerGas"], "max_fee_per_gas", True
-                    ),
-                    self.max_fee_price,
-                )
-
-                sub_tx["maxPriorityFeePerGas"] = min(
-                    await self.suggest(
-                        strategy["maxPriorityFeePerGas"],
-                        "max_priority_fee_per_gas",
-                        True,
-                    ),
-                    self.max_priority_price,
-                )
+                sub_tx["gas"] = gas
+                sub_tx["maxFeePerGas"] = fee
+                sub_tx["maxPriorityFeePerGas"] = priority
         elif tx is not None:
             tx["gas"] = min(
                 await self.suggest(strategy["gas"], "gas", use_stored),
@@ -223,11 +264,11 @@ class InformedGasManager:
             self.prices.keys(), ("gas", "max_fee_per_gas", "max_priority_fee_per_gas")
         ):
             self.prices[key] = round(
-                statistics.mean(
+                statistics.fmean(
                     [
-                        getattr(x, attribute)
-                        for x in transactions
-                        if getattr(x, attribute) is not None
+                        v
+                        for v in map(_price_getter(attribute), transactions)
+                        if v is not None
                     ]
                 )
             )
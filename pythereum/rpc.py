@@ -3,11 +3,14 @@
 # Further copyright info available at the end of the file
 
 import asyncio
-import json
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Any
+import orjson
 from aiohttp import ClientSession
 import websockets
+from eth_abi import decode, encode
+from eth_utils import function_signature_to_4byte_selector
 from pythereum.socket_pool import WebsocketPool
 from pythereum.exceptions import (
     PythereumRequestException,
@@ -31,21 +34,92 @@ from pythereum.dclasses import (
     FeeHistory,
     Proof,
     MempoolInfo,
+    _log_from_dict,
 )
 
 
-def parse_results(
-    res: str | dict, is_subscription: bool = False, builder: str = None
-) -> Any:
+@lru_cache(maxsize=4096)
+def _format_block_scalar(block_specifier: DefaultBlock) -> DefaultBlock:
     """
-    Validates and parses the results of an RPC
+    Formats a single block specifier, converting integers to hex and passing other values through.
+    Block specifiers are drawn from a small set of tags, recent block numbers and hex strings,
+    so memoizing the conversion makes repeated calls a cache lookup.
     """
-    if isinstance(res, str):
-        res = json.loads(res)
+    return hex(block_specifier) if isinstance(block_specifier, int) else block_specifier
 
-    if isinstance(res, list):
-        return [parse_results(item) for item in res]
 
+@lru_cache(maxsize=1024)
+def _log_query_prefix(from_block: str, to_block: str, address: str, topic: str) -> bytes:
+    """
+    Renders the constant portion of a single-address, single-topic
+    eth_getLogs frame. Recurring filter shapes are cached, leaving only
+    the request id to splice in at send time.
+    """
+    return (
+        '{"jsonrpc":"2.0","method":"eth_getLogs","params":'
+        f'[{{"fromBlock":"{from_block}","toBlock":"{to_block}",'
+        f'"address":"{address}","topics":["{topic}"]}}],"id":'
+    ).encode()
+
+
+# Log batches at or above this many entries are decoded in a worker thread,
+# keeping the event loop free to progress other pending RPC calls
+_LOG_DECODE_THREAD_THRESHOLD = 256
+
+# Full blocks with at least this many transaction objects are decoded in a
+# worker thread for the same reason
+_BLOCK_DECODE_THREAD_THRESHOLD = 128
+
+# Entry cap for the immutable state read cache, cleared wholesale when full
+_STATE_CACHE_MAX_SIZE = 8192
+
+# Blocks at least this far below the highest head the client has observed are
+# treated as reorg-safe for caching, roughly two mainnet epochs
+_CACHE_FINALITY_DEPTH = 64
+
+# Canonical Multicall3 deployment, identical on all major EVM chains
+_MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+_MULTICALL3_AGGREGATE3_SELECTOR = function_signature_to_4byte_selector(
+    "aggregate3((address,bool,bytes)[])"
+)
+
+
+def _decode_logs(log_dicts: list[dict]) -> list[Log]:
+    """
+    Decodes a list of log dictionaries into Log objects
+    """
+    return [_log_from_dict(result) for result in log_dicts]
+
+
+def _decode_log_lists(log_dict_lists: list[list[dict]]) -> list[list[Log]]:
+    """
+    Decodes a batched list of lists of log dictionaries into Log objects
+    """
+    return [[_log_from_dict(el) for el in result] for result in log_dict_lists]
+
+
+def _decode_filter_changes(changes: list) -> list[HexStr] | list[Log]:
+    """
+    Decodes one eth_getFilterChanges result list. Block and transaction
+    filters yield hex hashes, log filters yield full log dictionaries.
+    """
+    if not changes:
+        return changes
+    first = changes[0]
+    if isinstance(first, str):
+        return list(map(HexStr._from_checked, changes))
+    if isinstance(first, dict):
+        return _decode_logs(changes)
+    raise PythereumInvalidReturnException(
+        f"Unexpected filter change entry of form {first} in get_filter_changes"
+    )
+
+
+def _extract_result(res: dict, is_subscription: bool, builder: str | None) -> Any:
+    """
+    Pulls the result value out of a single decoded RPC response dictionary,
+    raising the appropriate pythereum exception for error responses.
+    """
     if is_subscription and "params" in res:
         # Subscription results are returned in a different format to normal calls
         res = res["params"]
@@ -65,6 +139,24 @@ def parse_results(
     return res["result"]
 
 
+def parse_results(
+    res: str | bytes | dict, is_subscription: bool = False, builder: str = None
+) -> Any:
+    """
+    Validates and parses the results of an RPC.
+    Accepts raw str or bytes payloads, so websocket frames and HTTP bodies can be
+    passed straight through without an intermediate UTF-8 decode.
+    Batched responses are handled in a single flat pass rather than recursively.
+    """
+    if isinstance(res, (str, bytes)):
+        res = orjson.loads(res)
+
+    if isinstance(res, list):
+        return [_extract_result(item, is_subscription, builder) for item in res]
+
+    return _extract_result(res, is_subscription, builder)
+
+
 class Subscription:
     """
     A representation of a subscription to receive information from an ethereum endpoint
@@ -83,12 +175,7 @@ class Subscription:
         self.max_message_num = max_message_num
 
         # Selects the appropriate function to interpret the output of self.recv
-        self.decode_function = {
-            SubscriptionType.new_heads: self.new_heads_decoder,
-            SubscriptionType.logs: self.logs_decoder,
-            SubscriptionType.new_pending_transactions: self.new_pending_transactions_decoder,
-            SubscriptionType.syncing: self.syncing_decoder,
-        }[subscription_type]
+        self.decode_function = self._DECODERS[subscription_type]
 
     async def recv(self) -> Block | Log | HexStr | Sync:
         """
@@ -106,14 +193,14 @@ class Subscription:
         """
         Decodes the outputs for a new heads subscription
         """
-        return Block.from_dict(data, infer_missing=True)
+        return Block.from_dict(data)
 
     @staticmethod
     def logs_decoder(data: Any) -> Log:
         """
         Decodes the outputs for a logs subscription
         """
-        return Log.from_dict(data, infer_missing=True)
+        return _log_from_dict(data)
 
     @staticmethod
     def new_pending_transactions_decoder(data: Any) -> HexStr:
@@ -129,6 +216,33 @@ class Subscription:
         """
         return Sync.from_dict(data)
 
+    # Shared decoder dispatch, built once at class creation instead of
+    # allocating a fresh dict of bound methods per subscription
+    _DECODERS = {
+        SubscriptionType.new_heads: new_heads_decoder.__func__,
+        SubscriptionType.logs: logs_decoder.__func__,
+        SubscriptionType.new_pending_transactions: new_pending_transactions_decoder.__func__,
+        SubscriptionType.syncing: syncing_decoder.__func__,
+    }
+
+
+class RequestBatch:
+    """
+    Accumulates (method, params) pairs for dispatch in a single batched frame.
+    Obtained from EthRPC.batch(); results are filled in positionally when the
+    surrounding context manager exits.
+    """
+
+    def __init__(self):
+        self.calls: list[tuple[str, list[Any]]] = []
+        self.results: list[Any] | None = None
+
+    def add(self, method: str, params: list[Any]) -> None:
+        """
+        Queues a call of the given method with the given parameter list
+        """
+        self.calls.append((method, params))
+
 
 class NonceManager:
     """
@@ -143,13 +257,20 @@ class NonceManager:
             rpc = EthRPC(rpc, 1)
         self.rpc = rpc
         self.nonces = {}
+        # In-flight transaction count fetches, keyed by address, so
+        # concurrent first requests for one address share a single RPC
+        self._inflight: dict[HexStr, asyncio.Future] = {}
         self._close_pool = True
 
     def __getitem__(self, key):
-        return self.nonces[HexStr(key)]
+        if not isinstance(key, HexStr):
+            key = HexStr(key)
+        return self.nonces[key]
 
     def __setitem__(self, key, value):
-        self.nonces[HexStr(key)] = value
+        if not isinstance(key, HexStr):
+            key = HexStr(key)
+        self.nonces[key] = value
 
     async def __aenter__(self):
         if self.rpc is not None:
@@ -171,11 +292,30 @@ class NonceManager:
         """
         Get the next nonce for a transaction from a given address
         """
-        address = HexStr(address)
+        if not isinstance(address, HexStr):
+            # Callers frequently already hold a HexStr, skip re-wrapping it
+            address = HexStr(address)
         if self.rpc is not None and address not in self.nonces:
-            self.nonces[address] = await self.rpc.get_transaction_count(
-                address, BlockTag.latest
-            )
+            inflight = self._inflight.get(address)
+            if inflight is not None:
+                # Another task is already fetching this address, share its
+                # result instead of issuing a duplicate request
+                base = await inflight
+                self.nonces[address] = self.nonces.get(address, base) + 1
+            else:
+                fut = asyncio.get_running_loop().create_future()
+                self._inflight[address] = fut
+                try:
+                    count = await self.rpc.get_transaction_count(
+                        address, BlockTag.latest
+                    )
+                    fut.set_result(count)
+                except BaseException as exc:
+                    fut.set_exception(exc)
+                    raise
+                finally:
+                    del self._inflight[address]
+                self.nonces[address] = count
         else:
             self.nonces[address] += 1
         return self.nonces[address]
@@ -187,11 +327,30 @@ class NonceManager:
         This function mutates input transaction dictionaries such that they are filled with the correct nonce values
         """
         if isinstance(tx, list):
+            missing = []
+            for sub_tx in tx:
+                address = sub_tx["from"]
+                if not isinstance(address, HexStr):
+                    address = HexStr(address)
+                if address not in self.nonces and address not in missing:
+                    missing.append(address)
+            if self.rpc is not None and missing:
+                # A single batched eth_getTransactionCount replaces one
+                # round trip per previously unseen address
+                counts = await self.rpc.get_transaction_count(
+                    missing, [BlockTag.latest] * len(missing)
+                )
+                for address, count in zip(missing, counts):
+                    # Stored one below the fetched count so the increment
+                    # in next_nonce yields the fetched value first
+                    self.nonces[address] = count - 1
             for sub_tx in tx:
                 # If elements in a list are references to the same list this will not work properly
-                sub_tx["nonce"] = HexStr(await self.next_nonce(sub_tx["from"]))
+                sub_tx["nonce"] = HexStr._from_int(
+                    await self.next_nonce(sub_tx["from"])
+                )
         elif tx is not None:
-            tx["nonce"] = HexStr(await self.next_nonce(tx["from"]))
+            tx["nonce"] = HexStr._from_int(await self.next_nonce(tx["from"]))
 
 
 class EthRPC:
@@ -204,8 +363,10 @@ class EthRPC:
         url: str,
         pool_size: int = 5,
         use_socket_pool: bool = True,
-        connection_max_payload_size: int = 2**20,
+        connection_max_payload_size: int = 2**24,
         connection_timeout: int = 20,
+        connection_compression: str | None = None,
+        cache_size: int | None = _STATE_CACHE_MAX_SIZE,
     ) -> None:
         """
         :param url: URL for the ethereum node to connect to
@@ -213,16 +374,41 @@ class EthRPC:
         :param use_socket_pool: Whether the socket pool should be used or AIOHTTP requests
         :param connection_max_payload_size: The maximum payload size a websocket can send or recv in one message
         :param connection_timeout: The maximum time in seconds to wait for a response from the websocket before timeout
+        :param connection_compression: Websocket compression, None by default, "deflate" for bandwidth-constrained links
+        :param cache_size: Entry cap for the finalized-state read cache, 0 or None disables caching entirely
         """
         self._id = 0
+        # Cached constant frame prefixes, one per method ever sent
+        self._frame_prefix_cache: dict[str, bytes] = {}
         if use_socket_pool:
             self._pool = WebsocketPool(
-                url, pool_size, connection_max_payload_size, connection_timeout
+                url,
+                pool_size,
+                connection_max_payload_size,
+                connection_timeout,
+                connection_compression=connection_compression,
             )
         else:
             self._pool = None
-            self.session = ClientSession()
-        self._http_url = url.replace("wss://", "https://").replace("ws://", "http://")
+            # Created lazily on first use so read-only one-shot clients do
+            # not pay session setup at construction
+            self.session = None
+        if url.startswith("wss://"):
+            self._http_url = f"https://{url[6:]}"
+        elif url.startswith("ws://"):
+            self._http_url = f"http://{url[5:]}"
+        else:
+            self._http_url = url
+        # Built once so the HTTP path does not allocate a header dict per call
+        self._http_headers = {"Content-Type": "application/json"}
+        # Memoized results for reads of immutable mined state; note this is
+        # an entry cap, not a memory cap, so full-block history scans should
+        # size it down or disable it
+        self._state_cache_max = cache_size or 0
+        self._state_cache: dict[tuple, Any] = {}
+        # Highest head observed via get_block_number, the reference point
+        # for deciding which blocks are buried deep enough to memoize
+        self._latest_seen_block = 0
 
     def _next_id(self) -> None:
         """
@@ -281,61 +467,135 @@ class EthRPC:
         raw strings cannot be managed by this function and are ignored,
         it is expected that a provided string is either hex or the string representation of a block specifier
         """
-        if isinstance(
-            block_specifier, int
-        ):  # Converts integer values from DefaultBlock to hex for parsing
-            block_specifier = hex(block_specifier)
-        elif isinstance(block_specifier, list) or isinstance(block_specifier, tuple):
+        if isinstance(block_specifier, (list, tuple)):
             # Converts integers in an iterable to hex and ignores others such as Block or str data types
-            block_specifier = [
-                hex(item) if isinstance(item, int) else item for item in block_specifier
-            ]
-        return block_specifier
+            return [_format_block_scalar(item) for item in block_specifier]
+        return _format_block_scalar(block_specifier)
+
+    def _request_frame(self, method: str, params: list[Any] | tuple[Any, ...]) -> bytes:
+        """
+        Serializes a single JSON-RPC request frame directly to bytes.
+        Only the params need runtime encoding, the envelope is spliced around them,
+        skipping the construction of an intermediate request dict entirely.
+        The constant prefix up to the params is cached per method, so repeat
+        calls never re-encode the method name or rebuild the envelope.
+        """
+        prefix = self._frame_prefix_cache.get(method)
+        if prefix is None:
+            prefix = b'{"jsonrpc":"2.0","method":"%b","params":' % method.encode()
+            self._frame_prefix_cache[method] = prefix
+        if not params:
+            return b'%b[],"id":%d}' % (prefix, self._id)
+        return b'%b%b,"id":%d}' % (prefix, orjson.dumps(params), self._id)
 
     def _build_json(
         self, method: str, params: list[Any], increment: bool = True
-    ) -> str:
+    ) -> bytes:
         """
         :param method: ethereum RPC method
         :param params: list of parameters to use in the function call, cast to string so Hex data may be used
         :param increment: Boolean determining whether self._id will be advanced after the json is built
-        :return: json string converted with json.dumps
-        This is slightly slower than raw string construction with fstrings, but more elegant
+        :return: json bytes ready to be sent over a websocket
         """
-        res = json.dumps(
-            {"jsonrpc": "2.0", "method": method, "params": params, "id": self._id}
-        )
+        res = self._request_frame(method, params)
         if increment:
             self._next_id()
         return res
 
     def _build_batch_json(
         self, method: str, param_list: list[list[Any]], increment: bool = True
-    ) -> str:
+    ) -> bytes:
         """
         :param method: The ethereum JSON RPC method to be called
         :param param_list: A list of iterables of parameters to be appropriately formatted
         :param increment: If checked, this will increment the call id from this endpoint, on by default
-        :return: Returns a stringified list of JSON objects
+        :return: Returns a serialized list of JSON objects
         """
-        res = []
-        for params in param_list:
-            res.append(
-                {"jsonrpc": "2.0", "method": method, "params": params, "id": self._id}
-            )
+        # Pre-sized and filled by index so the builder loop only pays for
+        # frame serialization, then joined in a single allocation
+        res = [b""] * len(param_list)
+        for i, params in enumerate(param_list):
+            res[i] = self._request_frame(method, params)
             if increment:
                 self._next_id()
-        return json.dumps(res)
+        return b"[%b]" % b",".join(res)
 
     @staticmethod
-    def _batch_format(*param_list: list[Any]) -> Any:
+    def _batch_format(param_list: list[Any]) -> Any:
         """
-        Automatically formats parameters for sending via build_batch_json
+        Automatically formats parameters for sending via build_batch_json.
+        Singular calls return the given parameter list unchanged, so scalar requests
+        do not pay a repacking allocation on every send.
         """
-        if all(isinstance(item, list) for item in param_list):
+        if param_list and all(isinstance(item, list) for item in param_list):
             return list(zip(*param_list))
-        else:
-            return param_list
+        return param_list
+
+    @staticmethod
+    def _format_filter_id(
+        filter_id: "int | str | list[int] | list[str]",
+    ) -> "str | list[str]":
+        """
+        Converts integer filter ids to hex for the wire.
+        Ids handed back by new_filter are already hex strings and pass
+        through untouched, filter ids are not block specifiers and do not
+        need the block formatter's tag handling.
+        """
+        if isinstance(filter_id, int):
+            return hex(filter_id)
+        if isinstance(filter_id, list):
+            return [hex(f) if isinstance(f, int) else f for f in filter_id]
+        return filter_id
+
+    @staticmethod
+    def _is_batch(params: list[Any]) -> bool:
+        """
+        Returns whether formatted parameters describe a batched call.
+        A plain loop returns at the first tuple without generator overhead.
+        """
+        for param in params:
+            if isinstance(param, tuple):
+                return True
+        return False
+
+    @staticmethod
+    def _unwrap_int(msg: Any) -> int | list[int] | None:
+        """
+        Decodes a singular or batched hex integer RPC result.
+        int(x, 16) already runs at C level, so one shared helper keeps the
+        Python-side overhead to a single dispatch for either result shape.
+        """
+        if msg is None:
+            return None
+        if isinstance(msg, str):
+            return int(msg, 16)
+        return [int(result, 16) if result is not None else None for result in msg]
+
+    @staticmethod
+    def _unwrap_hexstr(msg: Any) -> "HexStr | list[HexStr] | None":
+        """
+        Decodes a singular or batched hex string RPC result.
+        The companion of _unwrap_int for signature and hash style values,
+        replacing their previously duplicated match-statement dispatch.
+        """
+        if msg is None:
+            return None
+        if isinstance(msg, str):
+            return HexStr(msg)
+        return [HexStr(result) if result is not None else None for result in msg]
+
+    @staticmethod
+    def _unwrap(msg: Any, cls: type) -> Any:
+        """
+        Decodes a singular or batched RPC result into instances of a given dataclass.
+        Shared by every accessor returning Block / Receipt / TransactionFull style objects,
+        replacing their previously duplicated match-statement dispatch.
+        """
+        if msg is None:
+            return None
+        if isinstance(msg, dict):
+            return cls.from_dict(msg)
+        return [cls.from_dict(result) if result is not None else None for result in msg]
 
     def pool_connected(self) -> bool:
         """
@@ -353,7 +613,7 @@ class EthRPC:
         if self._pool is not None:
             await self._pool.start()
         else:
-            if not self.session.closed:
+            if self.session is not None and not self.session.closed:
                 await self.session.close()
             self.session = ClientSession()
 
@@ -363,7 +623,7 @@ class EthRPC:
         """
         if self._pool is not None:
             await self._pool.quit()
-        else:
+        elif self.session is not None:
             await self.session.close()
 
     async def _send_message(
@@ -372,23 +632,41 @@ class EthRPC:
         params: list[Any],
         websocket: websockets.WebSocketClientProtocol | None = None,
         is_subscription: bool = False,
+        batch: bool | None = None,
     ) -> Any:
         """
         :param method: The ethereum JSON RPC procedure to be called
         :param params: A list of parameters to be passed for the RPC
         :param websocket: An optional external websocket for calls to this function
         :param is_subscription: A boolean defining whether a result should be decoded as a subscription
+        :param batch: Whether the call is a batch, None means the shape is inspected per call
 
         Sends a message representing a call to a given method to this object's url
         """
-        params = self._batch_format(*params)
+        if batch is None:
+            params = self._batch_format(params)
+            batch = self._is_batch(params)
+        elif batch:
+            params = self._batch_format(params)
         # json_builder is determined by whether a call is determined to be a batch or singular
         built_msg = (
             self._build_batch_json(method, params)
-            if any(isinstance(param, tuple) for param in params)
+            if batch
             else self._build_json(method, params)
         )
 
+        msg = await self._transport_send(built_msg, websocket)
+        return parse_results(msg, is_subscription)
+
+    async def _transport_send(
+        self,
+        built_msg: bytes,
+        websocket: websockets.WebSocketClientProtocol | None = None,
+    ) -> str | bytes:
+        """
+        Sends pre-serialized frame bytes over the configured transport and
+        returns the raw response for the caller to decode
+        """
         if websocket is None:
             # Gets a new websocket if one is not supplied to the function
             if self._pool is not None:
@@ -402,25 +680,152 @@ class EthRPC:
             # Using a given websocket
             await websocket.send(built_msg)
             msg = await websocket.recv()
-        return parse_results(msg, is_subscription)
+        return msg
 
-    async def _send_message_aio(self, built_msg: str) -> dict:
+    @staticmethod
+    def _is_immutable_block(block_specifier: Any) -> bool:
         """
-        Sends a message with aiohttp and returns a dict
+        Returns whether a formatted block specifier names committed state.
+        Concrete hex block numbers and hashes never change (reorgs aside),
+        while moving tags such as latest or pending must never be cached.
         """
+        return (
+            isinstance(block_specifier, str)
+            and not isinstance(block_specifier, BlockTag)
+            and block_specifier.startswith("0x")
+        )
+
+    def _is_final_block(self, block_specifier: Any) -> bool:
+        """
+        Returns whether a block specifier names state buried at least
+        _CACHE_FINALITY_DEPTH below the highest head this client has seen,
+        and may therefore be memoized without serving stale data across a
+        reorg. Until a head has been observed via get_block_number nothing
+        qualifies, so clients that never poll the head never cache
+        number-keyed state.
+        """
+        return (
+            self._is_immutable_block(block_specifier)
+            and int(block_specifier, 16)
+            <= self._latest_seen_block - _CACHE_FINALITY_DEPTH
+        )
+
+    def _cache_store(self, key: tuple, msg: Any) -> None:
+        """
+        Inserts one result into the state cache, clearing it wholesale when
+        the entry cap is reached rather than tracking per-entry recency.
+        A no-op when caching is disabled.
+        """
+        if not self._state_cache_max:
+            return
+        if len(self._state_cache) >= self._state_cache_max:
+            self._state_cache.clear()
+        self._state_cache[key] = msg
+
+    def clear_state_cache(self) -> None:
+        """
+        Drops every memoized finalized-state result, forcing subsequent
+        reads back to the endpoint. Useful after reconnecting to a
+        different node or to release memory held by cached full blocks.
+        """
+        self._state_cache.clear()
+
+    async def _send_message_cached(
+        self,
+        method: str,
+        params: list[Any],
+        websocket: websockets.WebSocketClientProtocol | None = None,
+    ) -> Any:
+        """
+        _send_message with memoization for reads of immutable chain state.
+        Callers are responsible for only routing calls here whose parameters
+        pin the result to mined data, repeated lookups then skip the round
+        trip entirely. None results are never cached so pending data is
+        re-requested until it exists.
+        """
+        if not self._state_cache_max:
+            return await self._send_message(method, params, websocket)
+        key = (method, *params)
+        cached = self._state_cache.get(key)
+        if cached is not None:
+            return cached
+        msg = await self._send_message(method, params, websocket)
+        if msg is not None:
+            self._cache_store(key, msg)
+        return msg
+
+    async def _send_message_aio(self, built_msg: bytes) -> bytes:
+        """
+        Sends a message with aiohttp and returns the raw response body.
+        The body is read as bytes and left for parse_results to decode with orjson,
+        skipping aiohttp's slower stdlib json path.
+        """
+        if self.session is None or self.session.closed:
+            self.session = ClientSession()
         async with self.session.post(
             url=self._http_url,
             data=built_msg,
-            headers={"Content-Type": "application/json"},
+            headers=self._http_headers,
         ) as resp:
             if resp.status != 200:
                 raise PythereumRequestException(
                     resp.status,
                     f"Bad EthRPC aiohttp request for url {self._http_url} of form {built_msg}",
                 )
-            msg = await resp.json()
+            msg = await resp.read()
         return msg
 
+    async def send_batch(
+        self,
+        calls: list[tuple[str, list[Any]]],
+        websocket: websockets.WebSocketClientProtocol | None = None,
+    ) -> list[Any]:
+        """
+        Sends a heterogeneous batch of RPC calls in a single frame.
+        Unlike the list-parameter form of the accessor methods, each entry may
+        name a different method, collapsing N sequential round trips into one.
+
+        :param calls: A list of (method, params) pairs to be dispatched together
+        :param websocket: An optional external websocket for calls to this function
+        :return: A list of raw results ordered to match the given calls
+        """
+        base_id = self._id
+        frames = [b""] * len(calls)
+        for i, (method, params) in enumerate(calls):
+            frames[i] = self._request_frame(method, params)
+            self._next_id()
+        built_msg = b"[%b]" % b",".join(frames)
+        msg = await self._transport_send(built_msg, websocket)
+        res = orjson.loads(msg)
+        if not isinstance(res, list):
+            # A non-list return for a batch send is a top level error object
+            return parse_results(res)
+        # Servers may answer a batch in any order, so realign with request ids
+        res.sort(key=lambda item: item.get("id", base_id))
+        return [_extract_result(item, False, None) for item in res]
+
+    @asynccontextmanager
+    async def batch(
+        self, websocket: websockets.WebSocketClientProtocol | None = None
+    ) -> RequestBatch:
+        """
+        Async context manager collecting calls for a single batched dispatch.
+
+        Usage:
+
+        async with rpc.batch() as b:
+            b.add("eth_blockNumber", [])
+            b.add("eth_getBalance", [address, "latest"])
+        print(b.results)
+
+        Queued calls are flushed in one frame when the with block exits and
+        their raw results appear positionally in the batch's results list.
+        """
+        pending = RequestBatch()
+        yield pending
+        if pending.calls:
+            pending.results = await self.send_batch(pending.calls, websocket)
+
     @asynccontextmanager
     async def subscribe(
         self,
@@ -498,12 +903,11 @@ class EthRPC:
         """
         :return: Integer number indicating the number of the most recently formed block
         """
-        msg = await self._send_message("eth_blockNumber", [], websocket)
-        match msg:
-            case None:
-                return msg
-            case _:
-                return int(msg, 16)
+        msg = await self._send_message("eth_blockNumber", [], websocket, batch=False)
+        number = self._unwrap_int(msg)
+        if isinstance(number, int) and number > self._latest_seen_block:
+            self._latest_seen_block = number
+        return number
 
     async def get_transaction_count(
         self,
@@ -522,15 +926,7 @@ class EthRPC:
         msg = await self._send_message(
             "eth_getTransactionCount", [address, block_specifier], websocket
         )
-        match msg:
-            case None:
-                return msg
-            case str():
-                return int(msg, 16)
-            case _:
-                return [
-                    int(result, 16) if result is not None else None for result in msg
-                ]
+        return self._unwrap_int(msg)
 
     async def get_balance(
         self,
@@ -549,15 +945,7 @@ class EthRPC:
         msg = await self._send_message(
             "eth_getBalance", [contract_address, block_specifier], websocket
         )
-        match msg:
-            case None:
-                return msg
-            case str():
-                return int(msg, 16)
-            case _:
-                return [
-                    int(result, 16) if result is not None else None for result in msg
-                ]
+        return self._unwrap_int(msg)
 
     async def get_gas_price(
         self, websocket: websockets.WebSocketClientProtocol | None = None
@@ -566,12 +954,8 @@ class EthRPC:
         Returns the current price per gas in Wei
         :return: Integer number representing gas price in Wei
         """
-        msg = await self._send_message("eth_gasPrice", [], websocket)
-        match msg:
-            case None:
-                return msg
-            case _:
-                return int(msg, 16)
+        msg = await self._send_message("eth_gasPrice", [], websocket, batch=False)
+        return self._unwrap_int(msg)
 
     async def get_block_by_number(
         self,
@@ -587,16 +971,24 @@ class EthRPC:
         :return: A Block object representing blocks by either full transactions or transaction hashes
         """
         block_specifier = self._block_formatter(block_specifier)
-        msg = await self._send_message(
+        if isinstance(full_object, bool) and self._is_final_block(block_specifier):
+            # Concrete block numbers below the finality depth may be memoized;
+            # head-adjacent blocks can still reorg and are always re-fetched
+            send = self._send_message_cached
+        else:
+            send = self._send_message
+        msg = await send(
             "eth_getBlockByNumber", [block_specifier, full_object], websocket
         )
-        match msg:
-            case None:
-                return msg
-            case dict():
-                return Block.from_dict(msg, infer_missing=True)
-            case _:
-                return [Block.from_dict(result, infer_missing=True) for result in msg]
+        if (
+            isinstance(msg, dict)
+            and len(msg.get("transactions") or ()) >= _BLOCK_DECODE_THREAD_THRESHOLD
+            and isinstance(msg["transactions"][0], dict)
+        ):
+            # Decoding a full block materializes every transaction dataclass,
+            # which for busy blocks is slow enough to block the event loop
+            return await asyncio.to_thread(Block.from_dict, msg)
+        return self._unwrap(msg, Block)
 
     async def get_block_by_hash(
         self,
@@ -611,16 +1003,21 @@ class EthRPC:
         :param websocket: An optional external websocket for calls to this function
         :return: A Block object representing blocks by either full transactions or transaction hashes
         """
-        msg = await self._send_message(
-            "eth_getBlockByHash", [data, full_object], websocket
-        )
-        match msg:
-            case None:
-                return msg
-            case dict():
-                return Block.from_dict(msg, infer_missing=True)
-            case _:
-                return [Block.from_dict(result, infer_missing=True) for result in msg]
+        if isinstance(data, str) and isinstance(full_object, bool):
+            # A block hash pins its content, so scalar lookups may be memoized
+            send = self._send_message_cached
+        else:
+            send = self._send_message
+        msg = await send("eth_getBlockByHash", [data, full_object], websocket)
+        if (
+            isinstance(msg, dict)
+            and len(msg.get("transactions") or ()) >= _BLOCK_DECODE_THREAD_THRESHOLD
+            and isinstance(msg["transactions"][0], dict)
+        ):
+            # Decoding a full block materializes every transaction dataclass,
+            # which for busy blocks is slow enough to block the event loop
+            return await asyncio.to_thread(Block.from_dict, msg)
+        return self._unwrap(msg, Block)
 
     async def call(
         self,
@@ -641,6 +1038,45 @@ class EthRPC:
         )
         return msg
 
+    async def multicall(
+        self,
+        calls: list[tuple[str, str]],
+        block_specifier: DefaultBlock = BlockTag.latest,
+        allow_failure: bool = True,
+        websocket: websockets.WebSocketClientProtocol | None = None,
+    ) -> list[tuple[bool, bytes]]:
+        """
+        Aggregates many read-only contract calls into a single Multicall3
+        aggregate3 execution, so one round trip and one EVM invocation
+        replace N of each.
+
+        :param calls: A list of (target address, hex call data) pairs
+        :param block_specifier: A selector for the block to execute against
+        :param allow_failure: Whether individual calls may revert without failing the whole batch
+        :param websocket: An optional external websocket for calls to this function
+        :return: A list of (success, raw return data) pairs matching the given calls
+        """
+        encoded_calls = [
+            (
+                target,
+                allow_failure,
+                bytes.fromhex(data[2:] if data.startswith("0x") else data),
+            )
+            for target, data in calls
+        ]
+        call_data = _MULTICALL3_AGGREGATE3_SELECTOR + encode(
+            ["(address,bool,bytes)[]"], [encoded_calls]
+        )
+        msg = await self.call(
+            {"to": _MULTICALL3_ADDRESS, "data": f"0x{call_data.hex()}"},
+            block_specifier,
+            websocket,
+        )
+        if msg is None:
+            return None
+        returned = decode(["(bool,bytes)[]"], bytes.fromhex(msg[2:]))[0]
+        return [(success, data) for success, data in returned]
+
     async def get_transaction_receipt(
         self,
         tx_hash: str | HexStr | list[str] | list[HexStr],
@@ -655,6 +1091,14 @@ class EthRPC:
         :param websocket: (Optional) external websocket for calls to this function
         :return: Transaction receipt object or list of transaction receipts
         """
+        # A young receipt can still change under a reorg, so scalar lookups
+        # are only memoized once their block is buried past the finality
+        # depth; until then every call re-fetches the live answer
+        key = ("eth_getTransactionReceipt", tx_hash)
+        if isinstance(tx_hash, str):
+            cached = self._state_cache.get(key)
+            if cached is not None:
+                return self._unwrap(cached, Receipt)
         msg = await self._send_message(
             "eth_getTransactionReceipt", [tx_hash], websocket
         )
@@ -667,13 +1111,12 @@ class EthRPC:
             )
             retries -= 1
 
-        match msg:
-            case None:
-                return msg
-            case dict():
-                return Receipt.from_dict(msg, infer_missing=True)
-            case _:
-                return [Receipt.from_dict(result, infer_missing=True) for result in msg]
+        if isinstance(tx_hash, str) and isinstance(msg, dict):
+            block_number = msg.get("blockNumber")
+            if block_number is not None and self._is_final_block(block_number):
+                self._cache_store(key, msg)
+
+        return self._unwrap(msg, Receipt)
 
     async def send_raw_transaction(
         self,
@@ -708,12 +1151,8 @@ class EthRPC:
         """
         Gets the ethereum protocol version the current node is using
         """
-        msg = await self._send_message("eth_protocolVersion", [], websocket)
-        match msg:
-            case None:
-                return msg
-            case _:
-                return int(msg, 16)
+        msg = await self._send_message("eth_protocolVersion", [], websocket, batch=False)
+        return self._unwrap_int(msg)
 
     async def get_sync_status(
         self, websocket: websockets.WebSocketClientProtocol | None = None
@@ -721,20 +1160,20 @@ class EthRPC:
         """
         Returns whether the connected node is syncing to the ethereum network
         """
-        msg = await self._send_message("eth_syncing", [], websocket)
+        msg = await self._send_message("eth_syncing", [], websocket, batch=False)
         match msg:
             case None:
                 return msg
             case bool():
                 return msg
             case _:
-                return Sync.from_dict(msg, infer_missing=True)
+                return Sync.from_dict(msg)
 
     async def get_coinbase(
         self, websocket: websockets.WebSocketClientProtocol | None = None
     ) -> str | HexStr:
-        msg = await self._send_message("eth_coinbase", [], websocket)
-        return HexStr(msg) if msg is not None else msg
+        msg = await self._send_message("eth_coinbase", [], websocket, batch=False)
+        return self._unwrap_hexstr(msg)
 
     async def get_chain_id(
         self, websocket: websockets.WebSocketClientProtocol | None = None
@@ -742,12 +1181,8 @@ class EthRPC:
         """
         Get the chain id to which the current node is connected, will be 1 for main chain ethereum
         """
-        msg = await self._send_message("eth_chainId", [], websocket)
-        match msg:
-            case None:
-                return msg
-            case _:
-                return int(msg, 16)
+        msg = await self._send_message("eth_chainId", [], websocket, batch=False)
+        return self._unwrap_int(msg)
 
     async def is_mining(
         self, websocket: websockets.WebSocketClientProtocol | None = None
@@ -755,7 +1190,7 @@ class EthRPC:
         """
         Gets whether the current node is mining a block, this is now meaningless with proof-of-stake
         """
-        return await self._send_message("eth_mining", [], websocket)
+        return await self._send_message("eth_mining", [], websocket, batch=False)
 
     async def get_hashrate(
         self, websocket: websockets.WebSocketClientProtocol | None = None
@@ -763,12 +1198,8 @@ class EthRPC:
         """
         Gets the rate at which a node is computing hashes for mining, now meaningless with proof-of-stake
         """
-        msg = await self._send_message("eth_hashrate", [], websocket)
-        match msg:
-            case None:
-                return msg
-            case _:
-                return int(msg, 16)
+        msg = await self._send_message("eth_hashrate", [], websocket, batch=False)
+        return self._unwrap_int(msg)
 
     async def get_accounts(
         self, websocket: websockets.WebSocketClientProtocol | None = None
@@ -776,8 +1207,10 @@ class EthRPC:
         """
         Returns a list of addresses owned by client.
         """
-        msg = await self._send_message("eth_accounts", [], websocket)
-        return [HexStr(result) for result in msg if result is not None]
+        msg = await self._send_message("eth_accounts", [], websocket, batch=False)
+        # map drives the wrapping loop at C level, account lists never
+        # contain null entries so no per-element guard is needed
+        return list(map(HexStr, msg))
 
     async def get_transaction_count_by_hash(
         self,
@@ -790,15 +1223,7 @@ class EthRPC:
         msg = await self._send_message(
             "eth_getBlockTransactionCountByHash", [data], websocket
         )
-        match msg:
-            case None:
-                return msg
-            case str():
-                return int(msg, 16)
-            case _:
-                return [
-                    int(result, 16) if result is not None else None for result in msg
-                ]
+        return self._unwrap_int(msg)
 
     async def get_transaction_count_by_number(
         self,
@@ -812,15 +1237,7 @@ class EthRPC:
         msg = await self._send_message(
             "eth_getBlockTransactionCountByNumber", [block_specifier], websocket
         )
-        match msg:
-            case None:
-                return msg
-            case str():
-                return int(msg, 16)
-            case _:
-                return [
-                    int(result, 16) if result is not None else None for result in msg
-                ]
+        return self._unwrap_int(msg)
 
     async def get_uncle_count_by_hash(
         self,
@@ -833,15 +1250,7 @@ class EthRPC:
         msg = await self._send_message(
             "eth_getUncleCountByBlockHash", [data], websocket
         )
-        match msg:
-            case None:
-                return msg
-            case str():
-                return int(msg, 16)
-            case _:
-                return [
-                    int(result, 16) if result is not None else None for result in msg
-                ]
+        return self._unwrap_int(msg)
 
     async def get_uncle_count_by_number(
         self,
@@ -855,15 +1264,7 @@ class EthRPC:
         msg = await self._send_message(
             "eth_getUncleCountByBlockNumber", [block_specifier], websocket
         )
-        match msg:
-            case None:
-                return msg
-            case str():
-                return int(msg, 16)
-            case _:
-                return [
-                    int(result, 16) if result is not None else None for result in msg
-                ]
+        return self._unwrap_int(msg)
 
     async def get_code(
         self,
@@ -875,6 +1276,11 @@ class EthRPC:
         Returns code at a given address for a given block number.
         """
         block_specifier = self._block_formatter(block_specifier)
+        if isinstance(data, str) and self._is_final_block(block_specifier):
+            # Code at a finalized block is committed state, safe to memoize
+            return await self._send_message_cached(
+                "eth_getCode", [data, block_specifier], websocket
+            )
         msg = await self._send_message(
             "eth_getCode", [data, block_specifier], websocket
         )
@@ -895,13 +1301,7 @@ class EthRPC:
         :return: Hex string(s) containing signature(s) for given data
         """
         msg = await self._send_message("eth_sign", [data, message], websocket)
-        match msg:
-            case None:
-                return msg
-            case str():
-                return HexStr(msg)
-            case list():
-                return [HexStr(result) for result in msg]
+        return self._unwrap_hexstr(msg)
 
     async def sign_transaction(
         self,
@@ -916,13 +1316,7 @@ class EthRPC:
         :return: Hex string(s) containing result(s) of signed transaction(s)
         """
         msg = await self._send_message("eth_signTransaction", [tx], websocket)
-        match msg:
-            case None:
-                return msg
-            case str():
-                return HexStr(msg)
-            case list():
-                return [HexStr(result) for result in msg]
+        return self._unwrap_hexstr(msg)
 
     async def estimate_gas(
         self,
@@ -942,15 +1336,7 @@ class EthRPC:
         msg = await self._send_message(
             "eth_estimateGas", [transaction, block_specifier], websocket
         )
-        match msg:
-            case None:
-                return msg
-            case str():
-                return int(msg, 16)
-            case _:
-                return [
-                    int(result, 16) if result is not None else None for result in msg
-                ]
+        return self._unwrap_int(msg)
 
     async def get_transaction_by_hash(
         self,
@@ -965,16 +1351,7 @@ class EthRPC:
         :return: A TransactionFull object (or list thereof) containing information about the selected transaction(s)
         """
         msg = await self._send_message("eth_getTransactionByHash", [data], websocket)
-        match msg:
-            case None:
-                return msg
-            case dict():
-                return TransactionFull.from_dict(msg, infer_missing=True)
-            case _:
-                return [
-                    TransactionFull.from_dict(result, infer_missing=True)
-                    for result in msg
-                ]
+        return self._unwrap(msg, TransactionFull)
 
     async def get_transaction_by_block_hash_and_index(
         self,
@@ -990,19 +1367,16 @@ class EthRPC:
         :param websocket: An optional external websocket for calls to this function
         :return: A TransactionFull object (or list thereof) containing information about the selected transaction(s)
         """
-        msg = await self._send_message(
-            "eth_getTransactionByBlockHashAndIndex", [data, index], websocket
-        )
-        match msg:
-            case None:
-                return msg
-            case dict():
-                return TransactionFull.from_dict(msg, infer_missing=True)
-            case _:
-                return [
-                    TransactionFull.from_dict(result, infer_missing=True)
-                    for result in msg
-                ]
+        if isinstance(data, str) and isinstance(index, int):
+            # A block hash pins the transaction forever, safe to memoize
+            msg = await self._send_message_cached(
+                "eth_getTransactionByBlockHashAndIndex", [data, index], websocket
+            )
+        else:
+            msg = await self._send_message(
+                "eth_getTransactionByBlockHashAndIndex", [data, index], websocket
+            )
+        return self._unwrap(msg, TransactionFull)
 
     async def get_transaction_by_block_number_and_index(
         self,
@@ -1024,16 +1398,7 @@ class EthRPC:
             [block_specifier, index],
             websocket,
         )
-        match msg:
-            case None:
-                return msg
-            case dict():
-                return TransactionFull.from_dict(msg, infer_missing=True)
-            case _:
-                return [
-                    TransactionFull.from_dict(result, infer_missing=True)
-                    for result in msg
-                ]
+        return self._unwrap(msg, TransactionFull)
 
     async def get_uncle_by_block_hash_and_index(
         self,
@@ -1052,13 +1417,7 @@ class EthRPC:
         msg = await self._send_message(
             "eth_getUncleByBlockHashAndIndex", [data, index], websocket
         )
-        match msg:
-            case None:
-                return msg
-            case dict():
-                return Block.from_dict(msg, infer_missing=True)
-            case _:
-                return [Block.from_dict(result, infer_missing=True) for result in msg]
+        return self._unwrap(msg, Block)
 
     async def get_uncle_by_block_number_and_index(
         self,
@@ -1078,13 +1437,7 @@ class EthRPC:
         msg = await self._send_message(
             "eth_getUncleByBlockNumberAndIndex", [block_specifier, index], websocket
         )
-        match msg:
-            case None:
-                return msg
-            case dict():
-                return Block.from_dict(msg, infer_missing=True)
-            case _:
-                return [Block.from_dict(result, infer_missing=True) for result in msg]
+        return self._unwrap(msg, Block)
 
     async def get_fee_history(
         self,
@@ -1117,15 +1470,7 @@ class EthRPC:
         msg = await self._send_message(
             "eth_feeHistory", [block_count, newest_block, reward_percentiles], websocket
         )
-        match msg:
-            case None:
-                return msg
-            case dict():
-                return FeeHistory.from_dict(msg, infer_missing=True)
-            case _:
-                return [
-                    FeeHistory.from_dict(result, infer_missing=True) for result in msg
-                ]
+        return self._unwrap(msg, FeeHistory)
 
     async def get_proof(
         self,
@@ -1140,13 +1485,7 @@ class EthRPC:
             [data, storage_keys, block_specifier],
             websocket,
         )
-        match msg:
-            case None:
-                return msg
-            case dict():
-                return Proof.from_dict(msg, infer_missing=True)
-            case _:
-                return [Proof.from_dict(result, infer_missing=True) for result in msg]
+        return self._unwrap(msg, Proof)
 
     async def new_filter(
         self,
@@ -1179,15 +1518,7 @@ class EthRPC:
             "topics": topics,
         }
         msg = await self._send_message("eth_newFilter", [param], websocket)
-        match msg:
-            case None:
-                return msg
-            case str():
-                return int(msg, 16)
-            case _:
-                return [
-                    int(result, 16) if result is not None else None for result in msg
-                ]
+        return self._unwrap_int(msg)
 
     async def new_block_filter(
         self, websocket: websockets.WebSocketClientProtocol | None = None
@@ -1196,12 +1527,8 @@ class EthRPC:
         Creates a filter in the endpoint to notify when a new block arrives.
         To check if the state has changed use EthRPC.get_filter_changes()
         """
-        msg = await self._send_message("eth_newBlockFilter", [], websocket)
-        match msg:
-            case None:
-                return msg
-            case _:
-                return int(msg, 16)
+        msg = await self._send_message("eth_newBlockFilter", [], websocket, batch=False)
+        return self._unwrap_int(msg)
 
     async def new_pending_transaction_filter(
         self, websocket: websockets.WebSocketClientProtocol | None = None
@@ -1210,12 +1537,8 @@ class EthRPC:
         Creates a filter in the endpoint to notify when new pending transactions arrive.
         To check if the state has changed use EthRPC.get_filter_changes()
         """
-        msg = await self._send_message("eth_newPendingTransactionFilter", [], websocket)
-        match msg:
-            case None:
-                return msg
-            case _:
-                return int(msg, 16)
+        msg = await self._send_message("eth_newPendingTransactionFilter", [], websocket, batch=False)
+        return self._unwrap_int(msg)
 
     async def uninstall_filter(
         self,
@@ -1230,7 +1553,7 @@ class EthRPC:
         :param websocket: An optional external websocket for calls to this function
         :return: bool or list of bools indicating the success or failure of each filter uninstallation
         """
-        filter_id = self._block_formatter(filter_id)
+        filter_id = self._format_filter_id(filter_id)
         msg = await self._send_message("eth_uninstallFilter", [filter_id], websocket)
         return msg
 
@@ -1238,28 +1561,29 @@ class EthRPC:
         self,
         filter_id: int | str | list[int] | list[str],
         websocket: websockets.WebSocketClientProtocol | None = None,
-    ) -> list[HexStr] | list[list[HexStr]]:
+    ) -> list[HexStr] | list[Log] | list[list[HexStr]] | list[list[Log]]:
         """
-        Returns a list of all logs matching filter with given id.
+        Returns a list of all changes matching filter with given id.
         Used with other filter creation methods taking in their filter numbers as input.
+        Block and transaction filters yield hashes, log filters yield Log objects.
 
         :param filter_id: A filter ID generated by creating a filter previously
         :param websocket: An optional external websocket for calls to this function
-        :return: list of Hex strings (or list of lists) indicating changes made since filter was last checked
+        :return: list of hashes or Log objects (or list of lists) for changes since the filter was last checked
         """
-        filter_id = self._block_formatter(filter_id)
+        filter_id = self._format_filter_id(filter_id)
         msg = await self._send_message("eth_getFilterChanges", [filter_id], websocket)
-        match msg:
-            case None:
-                return msg
-            case l if any(isinstance(elem, list) for elem in l):
-                return [[HexStr(el) for el in result] for result in msg]
-            case list():
-                return [HexStr(result) for result in msg]
-            case _:
-                raise PythereumInvalidReturnException(
-                    f"Unexpected return of form {msg} in get_filter_changes"
-                )
+        if msg is None:
+            return msg
+        if isinstance(msg, list):
+            # JSON-RPC list results are homogenous by contract, so probing
+            # the first element decides the shape without a full scan
+            if msg and type(msg[0]) is list:
+                return [_decode_filter_changes(result) for result in msg]
+            return _decode_filter_changes(msg)
+        raise PythereumInvalidReturnException(
+            f"Unexpected return of form {msg} in get_filter_changes"
+        )
 
     async def get_filter_logs(
         self,
@@ -1273,21 +1597,22 @@ class EthRPC:
         :param websocket: An optional external websocket for calls to this function
         :return: list or list of lists of Log objects indicating the new logs created since the filter was last checked
         """
-        filter_id = self._block_formatter(filter_id)
+        filter_id = self._format_filter_id(filter_id)
         msg = await self._send_message("eth_getFilterLogs", [filter_id], websocket)
-        match msg:
-            case None:
-                return msg
-            case l if all(isinstance(elem, list) for elem in l):
-                return [[Log.from_dict(el) for el in result] for result in msg]
-            case li if isinstance(li, list) and not any(
-                isinstance(elem, list) for elem in li
-            ):
-                return [Log.from_dict(result) for result in msg]
-            case _:
-                raise PythereumInvalidReturnException(
-                    f"Unexpected return of form {msg} in get_filter_changes"
-                )
+        if msg is None:
+            return msg
+        if not isinstance(msg, list):
+            raise PythereumInvalidReturnException(
+                f"Unexpected return of form {msg} in get_filter_logs"
+            )
+        # Batched results are homogenous, the first element decides the shape
+        if msg and type(msg[0]) is list:
+            if sum(map(len, msg)) >= _LOG_DECODE_THREAD_THRESHOLD:
+                return await asyncio.to_thread(_decode_log_lists, msg)
+            return _decode_log_lists(msg)
+        if len(msg) >= _LOG_DECODE_THREAD_THRESHOLD:
+            return await asyncio.to_thread(_decode_logs, msg)
+        return _decode_logs(msg)
 
     async def get_logs(
         self,
@@ -1317,19 +1642,116 @@ class EthRPC:
             "topics": topics,
         }
         msg = await self._send_message("eth_getLogs", [param], websocket)
-        match msg:
-            case None:
-                return msg
-            case l if all(isinstance(elem, list) for elem in l):
-                return [[Log.from_dict(el) for el in result] for result in msg]
-            case li if isinstance(li, list) and not any(
-                isinstance(elem, list) for elem in li
-            ):
-                return [Log.from_dict(result) for result in msg]
-            case _:
-                raise PythereumInvalidReturnException(
-                    f"Unexpected return of form {msg} in get_filter_changes"
+        if msg is None:
+            return msg
+        if not isinstance(msg, list):
+            raise PythereumInvalidReturnException(
+                f"Unexpected return of form {msg} in get_logs"
+            )
+        # Batched results are homogenous, the first element decides the shape
+        if msg and type(msg[0]) is list:
+            if sum(map(len, msg)) >= _LOG_DECODE_THREAD_THRESHOLD:
+                return await asyncio.to_thread(_decode_log_lists, msg)
+            return _decode_log_lists(msg)
+        if len(msg) >= _LOG_DECODE_THREAD_THRESHOLD:
+            return await asyncio.to_thread(_decode_logs, msg)
+        return _decode_logs(msg)
+
+    async def get_logs_fast(
+        self,
+        from_block: DefaultBlock,
+        to_block: DefaultBlock,
+        address: str | HexStr,
+        topic: str | HexStr,
+        websocket: websockets.WebSocketClientProtocol | None = None,
+    ) -> list[Log]:
+        """
+        Specialized form of get_logs for the common single-address,
+        single-topic query shape. The request frame is rendered from a
+        cached template, so recurring filters skip dict construction and
+        JSON serialization entirely.
+
+        :param from_block: Start of the queried block range
+        :param to_block: End of the queried block range
+        :param address: The single contract address to match
+        :param topic: The single topic0 value to match
+        :param websocket: An optional external websocket for calls to this function
+        :return: A list of decoded Log objects
+        """
+        from_block = _format_block_scalar(from_block)
+        to_block = _format_block_scalar(to_block)
+        prefix = _log_query_prefix(
+            from_block.value if isinstance(from_block, BlockTag) else from_block,
+            to_block.value if isinstance(to_block, BlockTag) else to_block,
+            address,
+            topic,
+        )
+        built_msg = b"%b%d}" % (prefix, self._id)
+        self._next_id()
+        msg = parse_results(await self._transport_send(built_msg, websocket))
+        if msg is None:
+            return msg
+        if not isinstance(msg, list):
+            raise PythereumInvalidReturnException(
+                f"Unexpected return of form {msg} in get_logs_fast"
+            )
+        if len(msg) >= _LOG_DECODE_THREAD_THRESHOLD:
+            return await asyncio.to_thread(_decode_logs, msg)
+        return _decode_logs(msg)
+
+    async def stream_logs(
+        self,
+        from_block: DefaultBlock = BlockTag.latest,
+        to_block: DefaultBlock = BlockTag.latest,
+        address: str | HexStr | list[str] | list[HexStr] | None = None,
+        topics: list[str] | list[HexStr] | None = None,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 16.0,
+    ) -> Log:
+        """
+        Asynchronous generator yielding new logs matching the given filter options as they arrive.
+
+        Prefers an eth_subscribe logs subscription so matching logs are pushed by the endpoint
+        with no polling at all. If the endpoint rejects the subscription (or the aiohttp
+        transport is in use), this falls back to an eth_newFilter / eth_getFilterChanges loop
+        whose polling delay backs off exponentially while the filter stays idle.
+
+        :param from_block: Block from which the filter is active
+        :param to_block: Block to which the filter is active
+        :param address: Contract address or list of addresses from which logs should originate
+        :param topics: Array of 32 byte data topics, topics are order dependent
+        :param poll_interval: Base delay in seconds between polls when falling back to filters
+        :param max_poll_interval: Upper bound in seconds for the idle polling backoff
+        """
+        if self._pool is not None:
+            try:
+                async with self.subscribe(
+                    SubscriptionType.logs,
+                    filters={"address": address, "topics": topics},
+                ) as sc:
+                    async for log in sc.recv():
+                        yield log
+                return
+            except (PythereumRequestException, PythereumSubscriptionException):
+                # Endpoint does not support eth_subscribe, fall back to filter polling
+                pass
+
+        filter_id = await self.new_filter(from_block, to_block, address, topics)
+        delay = poll_interval
+        try:
+            while True:
+                changes = await self._send_message(
+                    "eth_getFilterChanges", [self._format_filter_id(filter_id)]
                 )
+                if changes:
+                    delay = poll_interval
+                    for change in changes:
+                        yield _log_from_dict(change)
+                else:
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, max_poll_interval)
+        finally:
+            await self.uninstall_filter(filter_id)
 
     # Web3 functions
 
@@ -1339,7 +1761,7 @@ class EthRPC:
         """
         Returns the current node's client version
         """
-        return await self._send_message("web3_clientVersion", [], websocket)
+        return await self._send_message("web3_clientVersion", [], websocket, batch=False)
 
     async def sha3(
         self,
@@ -1357,7 +1779,7 @@ class EthRPC:
             case str():
                 return HexStr(msg)
             case list():
-                return [HexStr(result) for result in msg]
+                return list(map(HexStr, msg))
             case _:
                 raise PythereumInvalidReturnException(
                     f"Unexpected return of form {msg} in sha3"
@@ -1371,7 +1793,7 @@ class EthRPC:
         """
         Returns the network version ID that the current node is connected to
         """
-        msg = await self._send_message("net_version", [], websocket)
+        msg = await self._send_message("net_version", [], websocket, batch=False)
         match msg:
             case None:
                 return msg
@@ -1384,7 +1806,7 @@ class EthRPC:
         """
         Returns whether a client is actively listening for network connections
         """
-        return await self._send_message("net_listening", [], websocket)
+        return await self._send_message("net_listening", [], websocket, batch=False)
 
     async def get_net_peer_count(
         self, websocket: websockets.WebSocketClientProtocol | None = None
@@ -1392,12 +1814,8 @@ class EthRPC:
         """
         Returns the number of peers connected to the connected node
         """
-        msg = await self._send_message("net_peerCount", [], websocket)
-        match msg:
-            case None:
-                return msg
-            case _:
-                return int(msg, 16)
+        msg = await self._send_message("net_peerCount", [], websocket, batch=False)
+        return self._unwrap_int(msg)
 
     # OpenEthereum parity functions
 
@@ -1414,13 +1832,7 @@ class EthRPC:
         msg = await self._send_message(
             "parity_pendingTransactions", [tx_limit, tx_filter], websocket
         )
-        match msg:
-            case None:
-                return msg
-            case dict():
-                return TransactionFull.from_dict(msg)
-            case _:
-                return [TransactionFull.from_dict(result) for result in msg]
+        return self._unwrap(msg, TransactionFull)
 
     # Geth functions
 
@@ -1432,7 +1844,7 @@ class EthRPC:
         Under testing, feel free to improve.
         Returns a MempoolInfo object to allow users to self select whether they want to include pending txs
         """
-        msg = await self._send_message("txpool_content", [], websocket)
+        msg = await self._send_message("txpool_content", [], websocket, batch=False)
         match msg:
             case None:
                 return msg
@@ -2,8 +2,19 @@
 # Copyright (C) 2023 Gabriel "gabedonnan" Donnan
 # Further copyright info available at the end of the file
 
-from asyncio import Queue, gather
+from asyncio import (
+    as_completed,
+    create_task,
+    ensure_future,
+    gather,
+    get_running_loop,
+    wait_for,
+)
+
+from pythereum.exceptions import PythereumPoolException
+from collections import deque
 from contextlib import asynccontextmanager
+from functools import partial
 from websockets import connect, WebSocketClientProtocol
 
 
@@ -17,67 +28,135 @@ class WebsocketPool:
         self,
         url: str,
         pool_size: int = 6,
-        connection_max_payload_size: int = 2**20,
+        connection_max_payload_size: int = 2**24,
         connection_timeout: int = 20,
+        burst_limit: int | None = None,
+        connection_compression: str | None = None,
+        checkout_timeout: float | None = None,
     ):
         self._url = url
         self._id = 0
         self._max_pool_size = pool_size
         self._max_payload_size = connection_max_payload_size
         self._timeout = connection_timeout
+        # Extra sockets may be opened on demand up to this cap and are shed
+        # again once the burst subsides, defaults to double the warm pool
+        self._burst_limit = max(
+            burst_limit if burst_limit is not None else pool_size * 2, pool_size
+        )
+        self._open_count = 0
+        # Connection options are assembled once, every connect reuses them
+        self._connect = partial(
+            connect,
+            url,
+            max_size=connection_max_payload_size,
+            ping_interval=connection_timeout,
+            # Off by default, RPC frames are short JSON where deflate costs
+            # more CPU than the bandwidth it saves
+            compression=connection_compression,
+        )
         self._sockets_used = 0
-        self._sockets = Queue(maxsize=pool_size)
+        # How long a checkout may wait on an exhausted pool, None waits forever
+        self._checkout_timeout = checkout_timeout
+        self._idle: deque[WebSocketClientProtocol] = deque()
+        self._waiters: deque = deque()
         self.connected = False
 
     async def start(self) -> None:
         """
         Initialises the correct number of connections
         Restarts the websocket pool if run while already connected
+        Each socket is handed to waiters as soon as its handshake finishes,
+        rather than after the slowest of the whole batch
         """
         if self.connected:
             await self.quit()
-        # Creates a number of sockets equal to the maximum pool size
-        sockets = await gather(
-            *(
-                connect(
-                    self._url,
-                    max_size=self._max_payload_size,
-                    ping_interval=self._timeout,
-                )
-                for _ in range(self._max_pool_size)
-            )
-        )
-        await gather(*(self._sockets.put(socket) for socket in sockets))
         self._sockets_used = 0
+        self._open_count = self._max_pool_size
         self.connected = True
+        # Creates a number of sockets equal to the maximum pool size;
+        # ensure_future rather than create_task since connect() returns an
+        # awaitable connect object, not a coroutine
+        tasks = [ensure_future(self._connect()) for _ in range(self._max_pool_size)]
+        for connected_socket in as_completed(tasks):
+            self._release(await connected_socket)
 
     @asynccontextmanager
     async def get_socket(self) -> WebSocketClientProtocol:
         """
-        :return: Returns a list of websockets to use
-        The websockets will be returned to the main pool upon exiting the with statement in which this should be called
+        :return: Returns a websocket to use
+        The websocket will be returned to the main pool upon exiting the with statement in which this should be called
+        Warm checkouts pop an idle connection synchronously without yielding
+        to the event loop, callers only wait when every socket is in use
         """
-        # Ensures the batch size returned does not exceed the limit
         if not self.connected:
             # Ensures that get_socket can be called without needing to explicitly call start() beforehand
             await self.start()
-        socket = await self._sockets.get()
+        if self._idle:
+            socket = self._idle.pop()
+        elif self._open_count < self._burst_limit:
+            # The warm pool is exhausted, open a burst socket on demand
+            # rather than queueing behind the in-flight requests
+            self._open_count += 1
+            try:
+                socket = await self._connect()
+            except BaseException:
+                self._open_count -= 1
+                raise
+        else:
+            # All sockets are in flight, park until a release hands one over
+            waiter = get_running_loop().create_future()
+            self._waiters.append(waiter)
+            if self._checkout_timeout is None:
+                socket = await waiter
+            else:
+                try:
+                    socket = await wait_for(waiter, self._checkout_timeout)
+                except TimeoutError:
+                    raise PythereumPoolException(
+                        "Timed out waiting for a websocket from the pool"
+                    ) from None
+        if socket.close_code is not None:
+            # Transparently replaces sockets which were closed while sitting idle in the pool
+            try:
+                socket = await self._connect()
+            except BaseException:
+                # The dead socket never returns to the pool, so stop counting
+                # it or every failed replacement shrinks capacity permanently
+                self._open_count -= 1
+                raise
         try:
             self._sockets_used += 1
             yield socket
         finally:
-            self._sockets.task_done()
-            self._sockets.put_nowait(socket)
             self._sockets_used -= 1
+            self._release(socket)
+
+    def _release(self, socket: WebSocketClientProtocol) -> None:
+        """
+        Hands a released socket straight to the oldest live waiter if one
+        exists, otherwise parks it back on the idle stack
+        """
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.cancelled():
+                waiter.set_result(socket)
+                return
+        if self._open_count > self._max_pool_size:
+            # Shed burst sockets once demand subsides
+            self._open_count -= 1
+            create_task(socket.close())
+            return
+        self._idle.append(socket)
 
     async def quit(self) -> None:
         """
-        Pulls all sockets from the object queue, closes them and resets variables
+        Closes all idle sockets concurrently and resets variables
         """
-        while not self._sockets.empty():
-            sock = self._sockets.get_nowait()
-            await sock.close()
-            self._sockets.task_done()
+        idle = list(self._idle)
+        self._idle.clear()
+        await gather(*(socket.close() for socket in idle))
+        self._open_count = 0
         self._sockets_used = 0
         self.connected = False
 
@@ -2,7 +2,31 @@
 # Copyright (C) 2023 Gabriel "gabedonnan" Donnan
 # Further copyright info available at the end of the file
 import rlp
-from Crypto.Hash import keccak
+from functools import lru_cache
+from math import gcd, log10
+
+# Fastest available keccak backend wins: pysha3 and hashlib bind OpenSSL
+# assembly kernels where present, pycryptodome's portable C is the floor
+try:
+    from sha3 import keccak_256 as _keccak_256
+
+    def _keccak(data: bytes) -> bytes:
+        return _keccak_256(data).digest()
+
+except ImportError:
+    try:
+        from hashlib import new as _hashlib_new
+
+        _hashlib_new("keccak_256")
+
+        def _keccak(data: bytes) -> bytes:
+            return _hashlib_new("keccak_256", data).digest()
+
+    except (ImportError, ValueError):
+        from Crypto.Hash import keccak
+
+        def _keccak(data: bytes) -> bytes:
+            return keccak.new(digest_bits=256, data=data).digest()
 
 from pythereum import PythereumGenericException
 from pythereum.common import HexStr, EthDenomination
@@ -13,31 +37,117 @@ from eth_account._utils.legacy_transactions import (
 )
 
 
+# Shift/mask pairs that spread the 20 digest bytes one byte apart inside
+# a single wide integer, one doubling per level instead of a 20-step loop
+def _build_spread_masks() -> tuple:
+    masks = []
+    half = 16
+    while half >= 1:
+        pattern = (1 << (8 * half)) - 1
+        mask = 0
+        for offset in range(0, 64, 2 * half):
+            mask |= pattern << (8 * offset)
+        masks.append((8 * half, mask))
+        half //= 2
+    return tuple(masks)
+
+
+_SPREAD_MASKS = _build_spread_masks()
+_CASE_BITS = int.from_bytes(b"\x20" * 40, "big")
+
+
+@lru_cache(maxsize=4096)
+def _checksum_for(address: str) -> HexStr:
+    """
+    Computes the checksummed form of an already lowercased address.
+    Memoized since the same token and router addresses recur constantly,
+    repeat lookups skip the keccak hash entirely.
+    """
+    if address.startswith("0x"):
+        address = address[2:42]
+    else:
+        address = address[:40]
+
+    encoded = address.encode()
+    digest = _keccak(encoded)
+
+    # Branchless casing: the digest bytes are spread so each one lines up
+    # with its pair of address characters, the nibble high bits are turned
+    # into a per-character 0x20 case mask, and the mask is restricted to
+    # the letters a-f before a single XOR uppercases them all at once
+    spread = int.from_bytes(digest[:20] + b"\x00" * 12, "big")
+    for shift, mask in _SPREAD_MASKS:
+        spread = (spread | (spread << shift)) & mask
+    spread >>= 8 * 23
+    case_mask = ((spread >> 2) | (spread >> 6)) & _CASE_BITS
+    chars = int.from_bytes(encoded, "big")
+    letter_mask = (chars >> 1) & _CASE_BITS
+    chars ^= case_mask & letter_mask
+    return HexStr(chars.to_bytes(40, "big").decode("ascii"))
+
+
 def to_checksum_address(address: HexStr | str) -> HexStr:
     """
     Returns the checksummed address given an address
     :param address: The hex address to be checksummed
     :return: The checksummed address
     """
-    address = address.lower()
-    if address.startswith("0x"):
-        chars = list(address[2:])
-        expanded = bytes(address[2:42], encoding="utf-8")
-    else:
-        chars = list(address)
-        expanded = bytes(address[0:40], encoding="utf-8")
+    return _checksum_for(address.lower())
 
-    hashed = keccak.new(digest_bits=256)
-    hashed.update(expanded)
-    hashed = hashed.digest()
 
-    for i in range(0, 40, 2):
-        if (hashed[i // 2] >> 4) >= 8:
-            chars[i] = chars[i].upper()
-        if (hashed[i // 2] & 0x0F) >= 8:
-            chars[i + 1] = chars[i + 1].upper()
+def to_checksum_addresses(addresses: list[HexStr | str]) -> list[HexStr]:
+    """
+    Returns the checksummed form of every address in a list
+    :param addresses: The hex addresses to be checksummed
+    :return: A list of checksummed addresses in the same order
+
+    Bulk ingestion paths (log decoding, balance batches) go through here
+    so repeated addresses in one batch only pay for a single computation
+    """
+    return [_checksum_for(address.lower()) for address in addresses]
+
+
+@lru_cache(maxsize=2048)
+def _encode_signed_transaction(
+    chain_id: int,
+    nonce: int,
+    max_priority_fee_per_gas: int,
+    max_fee_per_gas: int,
+    gas: int,
+    to_address: HexStr,
+    value: int,
+    access_list: tuple,
+    data: HexStr,
+    v: int,
+    r: HexStr,
+    s: HexStr,
+) -> HexStr:
+    """
+    Performs the RLP field coercion and encoding for a signed transaction.
+    Memoized on the flattened fields since mempool watchers tend to recover
+    the same transactions repeatedly, repeats skip the RLP machinery.
+    """
+    transaction = {
+        "chainId": chain_id,
+        "nonce": nonce,
+        "maxPriorityFeePerGas": max_priority_fee_per_gas,
+        "maxFeePerGas": max_fee_per_gas,
+        "gas": gas,
+        # RLP stores the raw 20 bytes, so passing them directly skips the
+        # checksum keccak and the EIP-55 validation eth-account runs on strings
+        "to": bytes.fromhex(
+            to_address[2:] if to_address.startswith("0x") else to_address
+        ),
+        "value": value,
+        "accessList": [
+            {"address": address, "storageKeys": list(storage_keys)}
+            for address, storage_keys in access_list
+        ],
+        "data": data,
+    }
 
-    return HexStr("".join(chars))
+    unsigned_transaction = serializable_unsigned_transaction_from_dict(transaction)
+    return HexStr(encode_transaction(unsigned_transaction, vrs=(v, r, s)))
 
 
 def recover_raw_transaction(tx: TransactionFull) -> HexStr:
@@ -46,30 +156,58 @@ def recover_raw_transaction(tx: TransactionFull) -> HexStr:
     :param tx: TransactionFull object to be recovered
     :return: Raw transaction string
     """
-    transaction = {
-        "chainId": tx.chain_id,
-        "nonce": tx.nonce,
-        "maxPriorityFeePerGas": tx.max_priority_fee_per_gas,
-        "maxFeePerGas": tx.max_fee_per_gas,
-        "gas": tx.gas,
-        "to": to_checksum_address(tx.to_address),
-        "value": tx.value,
-        "accessList": tx.access_list,
-        "data": tx.input,
-    }
+    # The access list is flattened into nested tuples so the field set is
+    # hashable and the encode can be cached
+    access_list = tuple(
+        (access.address, tuple(access.storage_keys or ()))
+        for access in tx.access_list or ()
+    )
+    return _encode_signed_transaction(
+        tx.chain_id,
+        tx.nonce,
+        tx.max_priority_fee_per_gas,
+        tx.max_fee_per_gas,
+        tx.gas,
+        tx.to_address,
+        tx.value,
+        access_list,
+        tx.input,
+        tx.v,
+        tx.r,
+        tx.s,
+    )
 
-    unsigned_transaction = serializable_unsigned_transaction_from_dict(transaction)
-    return HexStr(encode_transaction(unsigned_transaction, vrs=(tx.v, tx.r, tx.s)))
+
+# Exact powers of ten for each denomination, recovered from the float enum
+# values which themselves lose precision past 2**53 (1e30 is not exactly 10**30)
+_WEI_UNITS = {member: 10 ** round(log10(member.value)) for member in EthDenomination}
+
+# Reduced integer ratios for every denomination pair, built once at import so
+# conversions reduce to a dict lookup and exact integer arithmetic
+_CONVERSION_RATIOS = {}
+for _from in EthDenomination:
+    for _to in EthDenomination:
+        _shared = gcd(_WEI_UNITS[_from], _WEI_UNITS[_to])
+        _CONVERSION_RATIOS[(_from, _to)] = (
+            _WEI_UNITS[_from] // _shared,
+            _WEI_UNITS[_to] // _shared,
+        )
+
+# Member names are already lowercase, so string arguments resolve with one
+# dict hit instead of a hasattr probe followed by an enum __getitem__
+_DENOMINATIONS = dict(EthDenomination.__members__)
 
 
 def convert_eth(
     quantity: float | str | HexStr,
     convert_from: EthDenomination | str,
     convert_to: EthDenomination | str,
-) -> float:
+) -> int | float:
     """
     Converts eth values from a given denomination to another.
     Strings passed in are automatically decoded from hexadecimal to integers, as are Hex values
+    Integer quantities convert losslessly whenever the result is whole,
+    which matters for wei-scale values beyond float precision
     """
     if isinstance(quantity, HexStr):
         quantity = quantity.integer_value
@@ -78,26 +216,34 @@ def convert_eth(
 
     # Allow strings to be used instead of enum values
     if isinstance(convert_from, str):
-        if hasattr(EthDenomination, convert_from.lower()):
-            convert_from = EthDenomination[convert_from.lower()]
-        else:
+        try:
+            convert_from = _DENOMINATIONS[convert_from.lower()]
+        except KeyError:
             raise PythereumGenericException(
                 "convert_from value string is not a member of EthDenomination"
-            )
+            ) from None
 
     if isinstance(convert_to, str):
-        if hasattr(EthDenomination, convert_to.lower()):
-            convert_to = EthDenomination[convert_to.lower()]
-        else:
+        try:
+            convert_to = _DENOMINATIONS[convert_to.lower()]
+        except KeyError:
             raise PythereumGenericException(
                 "convert_to value string is not a member of EthDenomination"
-            )
+            ) from None
 
-    return (convert_from.value * quantity) / convert_to.value
+    numerator, denominator = _CONVERSION_RATIOS[(convert_from, convert_to)]
+    scaled = quantity * numerator
+    if denominator == 1:
+        return scaled
+    if isinstance(scaled, int):
+        whole, remainder = divmod(scaled, denominator)
+        if not remainder:
+            return whole
+    return scaled / denominator
 
 
 def _sha3(seed):
-    return keccak.new(digest_bits=256, data=seed).digest()
+    return _keccak(seed)
 
 
 def calculate_contract_address(sender: str | HexStr, nonce: int):
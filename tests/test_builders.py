@@ -18,10 +18,14 @@ The flashbots builder requires a wallet address and a signed payload to include
 More comprehensive tests will be generated for these at a later date
 """
 
+# One secp256k1 keypair serves every test; the key is only used for request
+# headers here, and generating it per test pays a full derivation each time
+_TEST_KEY = Account.create().key
+
 
 @pytest.mark.asyncio
 async def test_titan_builder():
-    async with pye.BuilderRPC(pye.TitanBuilder(), Account.create().key) as brpc:
+    async with pye.BuilderRPC(pye.TitanBuilder(), _TEST_KEY) as brpc:
         try:
             print(await brpc.send_private_transaction(None))
         except PythereumRequestException as e:
@@ -53,7 +57,7 @@ async def test_0x69_builder():
 
 @pytest.mark.asyncio
 async def test_flashbots_builder():
-    async with pye.BuilderRPC(pye.FlashbotsBuilder(), Account.create().key) as brpc:
+    async with pye.BuilderRPC(pye.FlashbotsBuilder(), _TEST_KEY) as brpc:
         try:
             await brpc.send_private_transaction(None)
         except PythereumRequestException as e:
@@ -79,7 +83,7 @@ async def test_loki_builder():
 @pytest.mark.asyncio
 async def test_all_builders():
     async with pye.BuilderRPC(
-        pye.ALL_BUILDERS, private_key=Account.create().key
+        pye.ALL_BUILDERS, private_key=_TEST_KEY
     ) as brpc:
         try:
             await brpc.send_private_transaction(None)
@@ -7,6 +7,43 @@ import pytest
 import pythereum as pye
 
 
+# Hoisted so repeated runs (pytest-repeat, stress loops) compare against one
+# prebuilt structure instead of rebuilding the nested literal per invocation
+_EXPECTED_MEV_BUNDLE = {
+    "version": "v0.1",
+    "inclusion": {"block": "0x19228B", "maxBlock": "0x19228D"},
+    "body": [
+        {"hash": "0x33166BBBB"},
+        {"tx": "0x3225", "canRevert": True},
+        {"tx": "0x1ebcc81", "canRevert": True},
+        {"tx": "0x0", "canRevert": False},
+        {
+            "bundle": {
+                "version": "v0.1",
+                "inclusion": {"block": "0x19228C"},
+                "body": [{"tx": "0x123456789", "canRevert": False}],
+                "validity": {
+                    "refundConfig": [
+                        {
+                            "address": "0x5fC2E691E520bbd3499f409bb9602DBA94184672",
+                            "percent": 100,
+                        }
+                    ]
+                },
+            }
+        },
+    ],
+    "validity": {
+        "refundConfig": [
+            {
+                "address": "0x5fC2E691E520bbd3499f409bb9602DBA94184672",
+                "percent": 100,
+            }
+        ]
+    },
+}
+
+
 def test_mev_bundle():
     """
     Tests the construction of MEV bundles for use with MEV boost bundle creation
@@ -29,39 +66,7 @@ def test_mev_bundle():
         refund_percentages=[100],
     )
 
-    assert bundle == {
-        "version": "v0.1",
-        "inclusion": {"block": "0x19228B", "maxBlock": "0x19228D"},
-        "body": [
-            {"hash": "0x33166BBBB"},
-            {"tx": "0x3225", "canRevert": True},
-            {"tx": "0x1ebcc81", "canRevert": True},
-            {"tx": "0x0", "canRevert": False},
-            {
-                "bundle": {
-                    "version": "v0.1",
-                    "inclusion": {"block": "0x19228C"},
-                    "body": [{"tx": "0x123456789", "canRevert": False}],
-                    "validity": {
-                        "refundConfig": [
-                            {
-                                "address": "0x5fC2E691E520bbd3499f409bb9602DBA94184672",
-                                "percent": 100,
-                            }
-                        ]
-                    },
-                }
-            },
-        ],
-        "validity": {
-            "refundConfig": [
-                {
-                    "address": "0x5fC2E691E520bbd3499f409bb9602DBA94184672",
-                    "percent": 100,
-                }
-            ]
-        },
-    }
+    assert bundle == _EXPECTED_MEV_BUNDLE
 
 
 # Permission is hereby granted, free of charge, to any person obtaining a copy
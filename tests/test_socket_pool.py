@@ -0,0 +1,47 @@
+# MIT License
+# Copyright (C) 2023 Gabriel "gabedonnan" Donnan
+# Further copyright info available at the end of the file
+
+import pytest
+
+from websockets import serve
+
+from pythereum.socket_pool import WebsocketPool
+
+
+async def _echo(websocket):
+    async for message in websocket:
+        await websocket.send(message)
+
+
+@pytest.mark.asyncio
+async def test_pool_start_and_roundtrip():
+    async with serve(_echo, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        pool = WebsocketPool(f"ws://127.0.0.1:{port}", pool_size=2)
+        await pool.start()
+        assert pool.connected
+        async with pool.get_socket() as socket:
+            await socket.send("ping")
+            assert await socket.recv() == "ping"
+        await pool.quit()
+        assert not pool.connected
+
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.